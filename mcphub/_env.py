@@ -0,0 +1,65 @@
+import functools
+import os
+import re
+import sys
+from pathlib import Path
+import click
+
+try:
+    from dotenv import dotenv_values
+except ImportError:
+    dotenv_values = None
+
+# KEY=value, optionally prefixed with export; a value wrapped in matching quotes is taken as-is
+_ENV_RE = re.compile(r'(?:export\s+)?([^=\s]+)\s*=\s*(?:"(.*)"|\'(.*)\'|(.*))$')
+
+@functools.lru_cache(maxsize=8)
+def _parse_env(path_str, mtime_ns, size):
+    if dotenv_values is not None:
+        return {k: v for k, v in dotenv_values(path_str).items() if v is not None}
+    values = {}
+    with open(path_str, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith('#'):
+                continue
+            m = _ENV_RE.match(line)
+            if m:
+                key, double, single, bare = m.groups()
+                values[key] = double if double is not None else single if single is not None else bare
+    return values
+
+def load_env_file(env_path=None):
+    if env_path is None:
+        env_path = Path.cwd() / ".env"
+    else:
+        env_path = Path(env_path)
+
+    try:
+        st = env_path.stat()
+    except FileNotFoundError:
+        return {}
+    values = _parse_env(str(env_path), st.st_mtime_ns, st.st_size)
+    os.environ.update(values)
+    return values
+
+@functools.lru_cache(maxsize=1)
+def load():
+    """Load ./.env into os.environ once per process, returning None when the file is missing"""
+    env_path = Path.cwd() / ".env"
+    if not env_path.is_file():
+        return None
+    return load_env_file(env_path)
+
+def require(bucket_opt=None, hint=None):
+    """Return the S3 bucket from --bucket or ./.env, exiting if the file or the bucket is missing"""
+    if load() is None:
+        click.echo("❌ Error: .env file not found in current directory")
+        if hint:
+            click.echo(hint)
+        sys.exit(1)
+    bucket = bucket_opt or os.environ.get('S3_BUCKET_NAME') or os.environ.get('AWS_BUCKET')
+    if not bucket:
+        click.echo("❌ Error: S3_BUCKET_NAME not found in .env file or --bucket option")
+        sys.exit(1)
+    return bucket
@@ -0,0 +1,14 @@
+import functools
+import re
+
+_GITHUB_PREFIX_RE = re.compile(r'^(?:git@github\.com:|.*github\.com/)')
+
+@functools.lru_cache(maxsize=256)
+def extract_repo_name(repo_url):
+    path = _GITHUB_PREFIX_RE.sub('', repo_url.strip().rstrip('/'), count=1)
+    if path.endswith('.git'):
+        path = path[:-4]
+    head, sep, repo = path.rpartition('/')
+    if not sep:
+        return None, None
+    return head.rpartition('/')[2], repo
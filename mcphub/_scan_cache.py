@@ -0,0 +1,51 @@
+import functools
+import hashlib
+import os
+import subprocess
+from pathlib import Path
+import orjson
+
+CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'mcphub' / 'scans'
+
+def head_sha(repo_path):
+    """Return the commit SHA checked out in repo_path, or None if git cannot tell"""
+    result = subprocess.run(
+        ["git", "-C", str(repo_path), "rev-parse", "HEAD"],
+        capture_output=True, text=True
+    )
+    return result.stdout.strip() if result.returncode == 0 else None
+
+@functools.lru_cache(maxsize=None)
+def tool_version(distribution):
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:
+        return "unknown"
+    try:
+        return version(distribution)
+    except PackageNotFoundError:
+        return "unknown"
+
+def cached_scan(name, sha, version, scan, *args):
+    """Return (scan(*args), hit), reusing a stored result for the same scanner, commit and scanner version"""
+    if not sha or os.environ.get('MCPHUB_NO_CACHE') == '1':
+        return scan(*args), False
+
+    key = hashlib.sha256(f"{name}:{sha}:{version}".encode()).hexdigest()
+    path = CACHE_DIR / f"{key}.json"
+    try:
+        return orjson.loads(path.read_bytes()), True
+    except (OSError, orjson.JSONDecodeError):
+        pass
+
+    result = scan(*args)
+    # Failed runs (missing tool, missing API key, timeout) are retried next time
+    if 'error' not in result:
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(path.name + '.tmp')
+            tmp.write_bytes(orjson.dumps(result))
+            os.replace(tmp, path)
+        except OSError:
+            pass
+    return result, False
@@ -1,10 +1,134 @@
 import os
-import json
+import re
+import shutil
+import stat
 import subprocess
+import tarfile
 import tempfile
 import sys
+import functools
+import urllib.parse
+from pathlib import Path
 from datetime import datetime
 from typing import Dict, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+import ijson
+import orjson
+import boto3
+import urllib3
+from botocore.auth import S3SigV4Auth
+from botocore.awsrequest import AWSRequest
+from botocore.config import Config
+from botocore.credentials import Credentials
+from botocore.exceptions import ClientError
+
+# Absolute import so the commit-keyed result cache also works when this file is run as a script
+try:
+    from mcphub import _scan_cache
+except ImportError:
+    _scan_cache = None
+
+try:
+    from bandit.core import config as bandit_config, constants as bandit_constants, manager as bandit_manager
+except ImportError:
+    bandit_manager = None
+
+# Python files per bandit process below which sharding isn't worth the extra startups
+BANDIT_FILES_PER_SHARD = 100
+# Keep each bandit command line well under ARG_MAX
+_BANDIT_ARGV_BUDGET = 100_000
+# Bandit's own -x defaults plus dependency, virtualenv and build trees that never hold the project's code;
+# pruned by exact directory name, since bandit -r would walk them and then drop each file by substring match
+_BANDIT_EXCLUDE_DIRS = {
+    ".svn", "CVS", ".bzr", ".hg", ".git", "__pycache__", ".tox", ".eggs",
+    "node_modules", "venv", ".venv", "site-packages", "build", "dist",
+}
+
+def _python_files(repo_path):
+    files = []
+    for root, dirs, names in os.walk(repo_path):
+        dirs[:] = [d for d in dirs if d not in _BANDIT_EXCLUDE_DIRS and not d.endswith(".egg")]
+        files.extend(os.path.join(root, n) for n in names if n.endswith(".py"))
+    return files
+
+def _bandit_json(files, timeout=120):
+    """Run one bandit process over files, returning (parsed JSON report or None, stderr)"""
+    # -q keeps the banner and progress bar off stdout, so the report comes straight through the pipe
+    cmd = ["bandit", "-q"] + list(files) + ["-f", "json", "-ll"]
+    result = subprocess.run(cmd, capture_output=True, timeout=timeout)
+    stderr = result.stderr.decode("utf-8", "replace")
+    start = result.stdout.find(b"{")
+    if start < 0:
+        return None, stderr
+    try:
+        return orjson.loads(result.stdout[start:]), stderr
+    except orjson.JSONDecodeError:
+        return None, stderr
+
+def _bandit_in_process(files):
+    """Run Bandit's manager in this interpreter, returning a report shaped like `bandit -f json -ll`"""
+    mgr = bandit_manager.BanditManager(bandit_config.BanditConfig(), "file", quiet=True)
+    mgr.discover_files(files)
+    mgr.run_tests()
+    return {
+        "errors": [{"filename": fname, "reason": reason} for fname, reason in mgr.get_skipped()],
+        "results": [issue.as_dict() for issue in mgr.get_issue_list(sev_level=bandit_constants.MEDIUM)],
+        "metrics": mgr.metrics.data,
+    }
+
+def _warm_bandit():
+    """Start bandit once so its imports and plugins are in the page cache before the real scan"""
+    try:
+        subprocess.run(["bandit", "--version"], capture_output=True, timeout=30)
+    except (OSError, subprocess.SubprocessError):
+        pass
+    if _scan_cache is not None:
+        _scan_cache.tool_version('bandit')
+
+def _merge_bandit_reports(reports):
+    merged = {"errors": [], "results": [], "metrics": {}}
+    totals = {}
+    for report in reports:
+        merged["errors"].extend(report.get("errors", []))
+        merged["results"].extend(report.get("results", []))
+        for name, values in report.get("metrics", {}).items():
+            if name == "_totals":
+                for key, value in values.items():
+                    totals[key] = totals.get(key, 0) + value
+            else:
+                merged["metrics"][name] = values
+    merged["metrics"]["_totals"] = totals
+    merged["results"].sort(key=lambda i: (i.get("filename", ""), i.get("line_number", 0)))
+    return merged
+
+def run_bandit_json(repo_path, timeout=120):
+    """
+    Run bandit over the Python files in repo_path and return (report, stderr); report is None
+    if bandit wrote none. Large repos are split across one bandit process per CPU and the JSON
+    reports merged; otherwise Bandit runs in-process when it is importable.
+    """
+    files = _python_files(repo_path)
+    if not files:
+        return _merge_bandit_reports([]), ""
+    
+    workers = min(os.cpu_count() or 1, len(files) // BANDIT_FILES_PER_SHARD)
+    if workers <= 1 and bandit_manager is not None:
+        try:
+            return _bandit_in_process(files), ""
+        except Exception:
+            pass
+    workers = max(1, workers)
+    
+    # More groups than workers only when the file list would overflow a command line
+    argv_size = sum(len(f) + 1 for f in files)
+    groups = max(workers, -(-argv_size // _BANDIT_ARGV_BUDGET))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        outputs = list(pool.map(lambda i: _bandit_json(files[i::groups], timeout=timeout), range(groups)))
+    
+    stderr = "".join(err for _, err in outputs)
+    if any(report is None for report, _ in outputs):
+        return None, stderr
+    return _merge_bandit_reports([report for report, _ in outputs]), stderr
 
 def run_bandit_scan(repo_path):
     """
@@ -26,49 +150,41 @@ def run_bandit_scan(repo_path):
         }
     
     try:
-        output_file = os.path.join(tempfile.gettempdir(), f"bandit_{datetime.now().timestamp()}.json")
-        
         print(f"   Running Bandit scanner on: {repo_path}")
         
-        result = subprocess.run(
-            ["bandit", "-r", repo_path, "-f", "json", "-o", output_file, "-ll"],
-            capture_output=True,
-            text=True,
-            timeout=120
-        )
-        
-        if os.path.exists(output_file):
-            with open(output_file, 'r') as f:
-                bandit_data = json.load(f)
-            os.remove(output_file)
-            
+        bandit_data, _ = run_bandit_json(repo_path)
+        
+        if bandit_data is not None:
             issues = bandit_data.get("results", [])
             metrics = bandit_data.get("metrics", {})
             
             severity_counts = {"high": 0, "medium": 0, "low": 0}
-            detailed_issues = []
+            # Issues land in their severity's bucket, so concatenating them replaces a sort
+            buckets = {"high": [], "medium": [], "low": []}
             
-            confidence_map = {"HIGH": "high", "MEDIUM": "medium", "LOW": "low"}
+            # Bandit uses the same HIGH/MEDIUM/LOW levels for severity and confidence
+            level = {"HIGH": "high", "MEDIUM": "medium", "LOW": "low"}.get
             
             for issue in issues:
-                severity = confidence_map.get(issue.get("issue_severity", "LOW").upper(), "low")
-                confidence = confidence_map.get(issue.get("issue_confidence", "LOW").upper(), "low")
+                get = issue.get
+                severity = level(get("issue_severity", "LOW").upper(), "low")
+                confidence = level(get("issue_confidence", "LOW").upper(), "low")
                 
                 severity_counts[severity] += 1
                 
-                detailed_issues.append({
-                    "title": issue.get("issue_text", "Unknown"),
+                cwe = get("issue_cwe")
+                buckets[severity].append({
+                    "title": get("issue_text", "Unknown"),
                     "severity": severity,
                     "confidence": confidence,
-                    "file": issue.get("filename", "Unknown"),
-                    "line_number": issue.get("line_number", 0),
-                    "test_id": issue.get("test_id", ""),
-                    "test_name": issue.get("test_name", ""),
-                    "cwe": issue.get("issue_cwe", {}).get("id") if isinstance(issue.get("issue_cwe"), dict) else 0
+                    "file": get("filename", "Unknown"),
+                    "line_number": get("line_number", 0),
+                    "test_id": get("test_id", ""),
+                    "test_name": get("test_name", ""),
+                    "cwe": cwe.get("id") if isinstance(cwe, dict) else 0
                 })
             
-            severity_order = {"high": 0, "medium": 1, "low": 2}
-            detailed_issues.sort(key=lambda x: severity_order.get(x["severity"], 3))
+            detailed_issues = buckets["high"] + buckets["medium"] + buckets["low"]
             
             total_lines = sum(m.get("loc", 0) for m in metrics.values() if isinstance(m, dict))
             
@@ -117,19 +233,20 @@ def save_bandit_report(repo_name, scan_result, repo_url):
     """Save bandit scan report to file"""
     os.makedirs("reports", exist_ok=True)
     
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
     report_file = f"reports/bandit-{repo_name}-{timestamp}.json"
     
     report = {
         "repository": repo_name,
         "repo_url": repo_url,
-        "scan_date": datetime.now().isoformat(),
+        "scan_date": now.isoformat(),
         "scanner": "Bandit",
         "result": scan_result
     }
     
-    with open(report_file, 'w') as f:
-        json.dump(report, f, indent=2)
+    with open(report_file, 'wb') as f:
+        f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
     
     return report_file
 
@@ -141,6 +258,9 @@ AWS_REGION = os.environ.get("AWS_REGION", "us-east-1")
 S3_BUCKET_NAME = os.environ.get("S3_BUCKET_NAME")
 S3_MCP_JSON_KEY = os.environ.get("S3_MCP_JSON_KEY", "mcp.json")
 GITHUB_TOKEN = os.environ.get("GITHUB_TOKEN")
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "mcphub"
+# Where targets are checked out; point at a tmpfs such as /dev/shm to keep scans off the disk
+MCP_SCAN_TMPDIR = os.environ.get("MCP_SCAN_TMPDIR") or None
 
 
 class BanditScanner:
@@ -178,40 +298,16 @@ class BanditScanner:
             return {"error": "Repository path not found", "issues": []}
         
         try:
-            # Create temp file for JSON output
-            output_file = os.path.join(tempfile.gettempdir(), f"bandit_report_{datetime.now().timestamp()}.json")
-            
             print(f"\n[Bandit] Scanning Python code for security issues...")
             
-            # Run bandit scan
-            result = subprocess.run(
-                [
-                    "bandit",
-                    "-r",  # Recursive
-                    repo_path,
-                    "-f", "json",  # JSON format
-                    "-o", output_file,  # Output file
-                    "-ll"  # Low confidence and low severity minimum
-                ],
-                capture_output=True,
-                text=True,
-                timeout=120
-            )
-            
             # Bandit exit codes: 0 = no issues, 1 = issues found, other = error
-            # Read the JSON output
-            if os.path.exists(output_file):
-                with open(output_file, 'r') as f:
-                    bandit_results = json.load(f)
-                
-                # Clean up temp file
-                os.remove(output_file)
-                
+            bandit_results, stderr = run_bandit_json(repo_path)
+            if bandit_results is not None:
                 return self._parse_bandit_results(bandit_results)
             else:
                 return {
                     "error": "Bandit did not generate output file",
-                    "details": result.stderr,
+                    "details": stderr,
                     "issues": []
                 }
                 
@@ -231,40 +327,38 @@ class BanditScanner:
             "low": 0
         }
         
-        confidence_map = {
+        # Bandit uses the same HIGH/MEDIUM/LOW levels for severity and confidence
+        level = {
             "HIGH": "high",
             "MEDIUM": "medium",
             "LOW": "low"
-        }
+        }.get
         
-        detailed_issues = []
+        # Issues land in their severity's bucket, so concatenating them replaces a sort
+        buckets = {"high": [], "medium": [], "low": []}
         
         for issue in issues:
-            severity = issue.get("issue_severity", "UNDEFINED").upper()
-            confidence = issue.get("issue_confidence", "UNDEFINED").upper()
+            get = issue.get
             
-            # Map Bandit severity to our format
-            sev_key = confidence_map.get(severity, "low")
-            if sev_key in severity_counts:
-                severity_counts[sev_key] += 1
+            # Map Bandit severity to our format; unknown levels count as low
+            sev_key = level(get("issue_severity", "UNDEFINED").upper(), "low")
+            severity_counts[sev_key] += 1
             
-            detailed_issues.append({
-                "title": issue.get("issue_text", "Unknown security issue"),
+            buckets[sev_key].append({
+                "title": get("issue_text", "Unknown security issue"),
                 "severity": sev_key,
-                "confidence": confidence_map.get(confidence, "low"),
-                "file": issue.get("filename", "Unknown"),
-                "line_number": issue.get("line_number", 0),
-                "code": issue.get("code", ""),
-                "test_id": issue.get("test_id", ""),
-                "test_name": issue.get("test_name", ""),
-                "cwe": issue.get("issue_cwe", {}).get("id", "N/A")
+                "confidence": level(get("issue_confidence", "UNDEFINED").upper(), "low"),
+                "file": get("filename", "Unknown"),
+                "line_number": get("line_number", 0),
+                "test_id": get("test_id", ""),
+                "test_name": get("test_name", ""),
+                "cwe": get("issue_cwe", {}).get("id", "N/A")
             })
         
-        # Sort by severity
-        severity_order = {"high": 0, "medium": 1, "low": 2}
-        detailed_issues.sort(key=lambda x: severity_order.get(x["severity"], 3))
+        detailed_issues = buckets["high"] + buckets["medium"] + buckets["low"]
         
-        total_lines = sum(metrics.get("_totals", {}).get("loc", 0) for metrics in [metrics])
+        totals = metrics.get("_totals", {})
+        total_lines = totals.get("loc", 0)
         
         return {
             "ok": len(issues) == 0,
@@ -276,55 +370,197 @@ class BanditScanner:
         }
 
 
+class _PeekedStream:
+    """File-like that replays the bytes already read from the front of a stream"""
+    
+    def __init__(self, head: bytes, body):
+        self._head = head
+        self._body = body
+    
+    def read(self, size=-1):
+        # ijson probes with read(0) to tell bytes from str; that must not consume the head
+        if self._head and size != 0:
+            head, self._head = self._head, b""
+            return head
+        return self._body.read(size)
+
+
+class _TeeStream:
+    """File-like that copies every chunk read from a stream into sink"""
+    
+    def __init__(self, body, sink):
+        self._body = body
+        self._sink = sink
+    
+    def read(self, size=-1):
+        chunk = self._body.read(size)
+        self._sink.write(chunk)
+        return chunk
+
+
+# Reused for every direct S3 GET in the process
+_http = urllib3.PoolManager(num_pools=4, maxsize=16)
+
+
+def _signed_get(access_key: str, secret_key: str, region: str, bucket: str, key: str, headers: Dict):
+    """GET an S3 object with a SigV4-signed request straight over urllib3, skipping boto3's client setup"""
+    endpoint = os.environ.get("AWS_ENDPOINT_URL_S3") or os.environ.get("AWS_ENDPOINT_URL")
+    path = urllib.parse.quote(key, safe="/~")
+    if endpoint:
+        url = f"{endpoint.rstrip('/')}/{bucket}/{path}"
+    else:
+        url = f"https://{bucket}.s3.{region}.amazonaws.com/{path}"
+    request = AWSRequest(method="GET", url=url, headers=headers)
+    credentials = Credentials(access_key, secret_key, os.environ.get("AWS_SESSION_TOKEN"))
+    S3SigV4Auth(credentials, "s3", region).add_auth(request)
+    return _http.request(
+        "GET", url, headers=dict(request.headers), preload_content=False,
+        retries=urllib3.Retry(total=2, redirect=False), timeout=urllib3.Timeout(connect=5, read=60)
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _s3_client(access_key: str, secret_key: str, region: str):
+    return boto3.client(
+        's3',
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
+        region_name=region,
+        config=Config(retries={'max_attempts': 3, 'mode': 'adaptive'}, tcp_keepalive=True, max_pool_connections=16)
+    )
+
+
 class S3Handler:
     """Handles S3 operations for fetching mcp.json"""
     
     def __init__(self, access_key: str, secret_key: str, region: str):
-        self.s3_client = boto3.client(
-            's3',
-            aws_access_key_id=access_key,
-            aws_secret_access_key=secret_key,
-            region_name=region
-        )
+        self._access_key = access_key
+        self._secret_key = secret_key
+        self._region = region
+        # Lowercased name -> server for the list last passed to find_mcp_by_name
+        self._indexed = None
+        self._name_index: Dict[str, Dict] = {}
+    
+    @property
+    def s3_client(self):
+        # Built on first use only; one client per credentials/region
+        return _s3_client(self._access_key, self._secret_key, self._region)
+    
+    def _get_object(self, bucket: str, key: str, etag: Optional[str]):
+        """Return (streaming body, ETag), or None when etag is still current"""
+        headers = {"If-None-Match": etag} if etag else {}
+        resp = None
+        if self._access_key and self._secret_key:
+            try:
+                resp = _signed_get(self._access_key, self._secret_key, self._region, bucket, key, headers)
+            except Exception:
+                resp = None
+        if resp is not None:
+            if resp.status == 304:
+                resp.release_conn()
+                return None
+            if resp.status == 200:
+                return resp, resp.headers["ETag"]
+            resp.release_conn()
+        
+        # Redirects to another region, custom setups and errors go through boto3
+        try:
+            response = self.s3_client.get_object(Bucket=bucket, Key=key, **({"IfNoneMatch": etag} if etag else {}))
+        except ClientError as e:
+            if etag and e.response['Error']['Code'] in ('304', 'NotModified'):
+                return None
+            raise
+        return response['Body'], response['ETag']
     
     def fetch_mcp_json(self, bucket: str, key: str) -> Optional[List[Dict]]:
-        """Fetch and parse mcp.json from S3"""
+        """Fetch and parse mcp.json from S3, reusing the local copy while its ETag still matches"""
+        cache_path = CACHE_DIR / f"{bucket}_{key.replace('/', '_')}"
+        etag_path = cache_path.with_name(cache_path.name + ".etag")
+        tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+        etag = None
+        if cache_path.is_file():
+            try:
+                etag = etag_path.read_text()
+            except OSError:
+                pass
+        
+        sink = None
+        body = None
         try:
             print(f"\n[S3] Fetching {key} from bucket: {bucket}")
-            response = self.s3_client.get_object(Bucket=bucket, Key=key)
-            content = response['Body'].read().decode('utf-8')
-            data = json.loads(content)
+            fetched = self._get_object(bucket, key, etag)
+            if fetched is None:
+                print("✓ mcp.json unchanged, using cached copy")
+                with open(cache_path, 'rb') as f:
+                    return self._parse_mcp_stream(f)
+            body, new_etag = fetched
             
-            # Handle different formats
-            if isinstance(data, list):
-                # Already an array of MCP servers
-                return data
-            elif isinstance(data, dict):
-                # Check if it's a nested structure with multiple keys
-                if "mcphub-servers" in data or "servers" in data:
-                    # Combine all arrays into one list
-                    all_servers = []
-                    if "mcphub-servers" in data and isinstance(data["mcphub-servers"], list):
-                        all_servers.extend(data["mcphub-servers"])
-                    if "servers" in data and isinstance(data["servers"], list):
-                        all_servers.extend(data["servers"])
-                    
-                    if all_servers:
-                        print(f"✓ Found nested structure with {len(all_servers)} total server(s)")
-                        return all_servers
-                    else:
-                        print("❌ No servers found in mcphub-servers or servers arrays")
-                        return None
-                else:
-                    # Single MCP server object, wrap it in a list
-                    return [data]
-            else:
-                print("❌ Invalid mcp.json format - expected array or object")
-                return None
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            sink = open(tmp_path, 'wb')
+            tee = _TeeStream(body, sink)
+            servers = self._parse_mcp_stream(tee)
+            if servers is not None:
+                # Copy whatever the parser left unread so the cached file is complete
+                while tee.read(65536):
+                    pass
+                sink.close()
+                os.replace(tmp_path, cache_path)
+                etag_path.write_text(new_etag)
+            return servers
                 
         except Exception as e:
             print(f"❌ Failed to fetch from S3: {e}")
             return None
+        finally:
+            if body is not None:
+                body.close()
+            if sink is not None:
+                sink.close()
+                if tmp_path.exists():
+                    tmp_path.unlink()
+    
+    def _parse_mcp_stream(self, body) -> Optional[List[Dict]]:
+        """Parse mcp.json from a binary stream into a list of MCP servers"""
+        # Peek at the first non-blank byte to tell the layouts apart, then parse while downloading
+        head = b""
+        while not head.strip():
+            chunk = body.read(1024)
+            if not chunk:
+                break
+            head += chunk
+        stream = _PeekedStream(head, body)
+        first = head.lstrip()[:1]
+        
+        # Handle different formats
+        if first == b"[":
+            # Already an array of MCP servers
+            return list(ijson.items(stream, "item", use_float=True))
+        elif first == b"{":
+            data = {}
+            all_servers = []
+            nested = False
+            for key, value in ijson.kvitems(stream, "", use_float=True):
+                if key in ("mcphub-servers", "servers"):
+                    # Nested structure: combine all arrays into one list
+                    nested = True
+                    if isinstance(value, list):
+                        all_servers.extend(value)
+                else:
+                    data[key] = value
+            
+            if nested:
+                if all_servers:
+                    print(f"✓ Found nested structure with {len(all_servers)} total server(s)")
+                    return all_servers
+                else:
+                    print("❌ No servers found in mcphub-servers or servers arrays")
+                    return None
+            else:
+                # Single MCP server object, wrap it in a list
+                return [data]
+        else:
+            print("❌ Invalid mcp.json format - expected array or object")
+            return None
     
     def find_mcp_by_name(self, mcp_servers: List[Dict], name: str) -> Optional[Dict]:
         """
@@ -337,10 +573,13 @@ class S3Handler:
         Returns:
             MCP server configuration dict or None if not found
         """
-        for mcp in mcp_servers:
-            if mcp.get("name", "").lower() == name.lower():
-                return mcp
-        return None
+        if self._indexed is not mcp_servers:
+            self._name_index = {}
+            for mcp in mcp_servers:
+                # setdefault keeps the first match, as the old linear scan did
+                self._name_index.setdefault(mcp.get("name", "").lower(), mcp)
+            self._indexed = mcp_servers
+        return self._name_index.get(name.lower())
     
     def list_available_mcps(self, mcp_servers: List[Dict]) -> None:
         """Print list of available MCP servers"""
@@ -359,13 +598,78 @@ class S3Handler:
         print("-" * 70)
 
 
+_GITHUB_REPO_RE = re.compile(r"^(?:https?://(?:[^@/]+@)?github\.com/|git@github\.com:)([\w.-]+)/([\w.-]+?)(?:\.git)?/?$")
+
+# Same set of files the sparse clone checks out
+_SCANNED_SUFFIXES = (".py", ".pyw")
+
+
 class GitHandler:
     """Handles Git repository operations"""
     
     @staticmethod
-    def clone_repository(repo_url: str, target_dir: str, token: Optional[str] = None) -> bool:
+    def fetch_tarball(repo_url: str, target_dir: str, token: Optional[str] = None) -> Optional[str]:
+        """
+        Download a GitHub repository snapshot through the tarball API, extracting only the files Bandit reads
+        
+        Returns:
+            The commit SHA of the snapshot ('' if GitHub did not record it), or None if the tarball
+            could not be fetched and the caller should fall back to git
+        """
+        match = _GITHUB_REPO_RE.match(repo_url)
+        if not match:
+            return None
+        owner, repo = match.groups()
+        headers = {"Accept": "application/vnd.github+json", "User-Agent": "mcphub-bandit"}
+        if token:
+            headers["Authorization"] = f"token {token}"
+        
+        print(f"\n[Git] Downloading tarball: {owner}/{repo}")
+        try:
+            # urllib3 drops the Authorization header on the redirect to codeload.github.com
+            resp = _http.request(
+                "GET", f"https://api.github.com/repos/{owner}/{repo}/tarball", headers=headers,
+                preload_content=False, timeout=urllib3.Timeout(connect=5, read=60)
+            )
+        except urllib3.exceptions.HTTPError as e:
+            print(f"   ⚠️  Tarball download failed ({e}), falling back to git clone")
+            return None
+        
+        try:
+            if resp.status != 200:
+                print(f"   ⚠️  Tarball download returned HTTP {resp.status}, falling back to git clone")
+                return None
+            
+            root = Path(target_dir).resolve()
+            with tarfile.open(fileobj=resp, mode="r|gz") as tar:
+                for member in tar:
+                    # Drop the "<owner>-<repo>-<sha>/" prefix and anything that could escape target_dir
+                    _, _, rel = member.name.partition("/")
+                    if not member.isfile() or not rel or not (rel.endswith(_SCANNED_SUFFIXES) or rel.rpartition("/")[2] == ".bandit"):
+                        continue
+                    dest = (root / rel).resolve()
+                    if root not in dest.parents:
+                        continue
+                    dest.parent.mkdir(parents=True, exist_ok=True)
+                    with tar.extractfile(member) as src, open(dest, "wb") as out:
+                        shutil.copyfileobj(src, out, 1024 * 1024)
+                # git archive records the commit in the pax global header
+                sha = tar.pax_headers.get("comment", "")
+        except (tarfile.TarError, OSError, urllib3.exceptions.HTTPError) as e:
+            print(f"   ⚠️  Tarball extraction failed ({e}), falling back to git clone")
+            shutil.rmtree(target_dir, ignore_errors=True)
+            os.makedirs(target_dir, exist_ok=True)
+            return None
+        finally:
+            resp.release_conn()
+        
+        print(f"✓ Repository extracted to: {target_dir}")
+        return sha
+    
+    @staticmethod
+    def clone_repository(repo_url: str, target_dir: str, token: Optional[str] = None) -> Optional[str]:
         """
-        Clone a Git repository
+        Fetch a Git repository, using the GitHub tarball API when possible and git otherwise
         
         Args:
             repo_url: GitHub repository URL
@@ -373,66 +677,111 @@ class GitHandler:
             token: Optional GitHub token for private repos
             
         Returns:
-            True if successful, False otherwise
+            The checked-out commit SHA ('' if unknown), or None on failure
         """
+        sha = GitHandler.fetch_tarball(repo_url, target_dir, token)
+        if sha is not None:
+            return sha
+        
         try:
             # Add token to URL if provided (for private repos)
             if token and "github.com" in repo_url:
                 repo_url = repo_url.replace("https://", f"https://{token}@")
             
             print(f"\n[Git] Cloning repository: {repo_url}")
-            Repo.clone_from(repo_url, target_dir, depth=1)  # Shallow clone
+            env = dict(os.environ, GIT_TERMINAL_PROMPT="0", GIT_HTTP_LOW_SPEED_LIMIT="1000", GIT_HTTP_LOW_SPEED_TIME="60")
+            # Shallow, blobless clone; only the files Bandit reads are fetched and checked out
+            subprocess.run(
+                ["git", "-c", "protocol.version=2", "clone", "--depth", "1", "--single-branch", "--no-tags",
+                 "--filter=blob:none", "--no-checkout", repo_url, target_dir],
+                check=True, capture_output=True, text=True, env=env
+            )
+            sparse = subprocess.run(
+                ["git", "-C", target_dir, "sparse-checkout", "set", "--no-cone", "*.py", "*.pyw", ".bandit"],
+                capture_output=True, text=True, env=env
+            )
+            if sparse.returncode != 0:
+                print("   ⚠️  sparse-checkout unavailable, checking out the full tree")
+            subprocess.run(["git", "-C", target_dir, "checkout"], check=True, capture_output=True, text=True, env=env)
             print(f"✓ Repository cloned to: {target_dir}")
-            return True
+            head = subprocess.run(["git", "-C", target_dir, "rev-parse", "HEAD"], capture_output=True, text=True)
+            return head.stdout.strip() if head.returncode == 0 else ""
+        except subprocess.CalledProcessError as e:
+            print(f"❌ Failed to clone repository: {e.stderr.strip()}")
+            return None
         except Exception as e:
             print(f"❌ Failed to clone repository: {e}")
-            return False
+            return None
+
+
+def _make_writable(func, path, _exc):
+    # git marks pack files read-only, which stops os.unlink on Windows
+    try:
+        os.chmod(path, stat.S_IWRITE)
+        func(path)
+    except OSError:
+        pass
+
+
+def _remove_tree(path: str):
+    """Delete a checkout, using rm -rf where available and a read-only-aware rmtree otherwise"""
+    if os.name != "nt" and shutil.which("rm"):
+        if subprocess.run(["rm", "-rf", "--", path], capture_output=True).returncode == 0:
+            return
+    if sys.version_info >= (3, 12):
+        shutil.rmtree(path, onexc=_make_writable)
+    else:
+        shutil.rmtree(path, onerror=_make_writable)
 
 
 def print_scan_report(scan_results: Dict, repo_name: str):
     """Print formatted scan report"""
-    print("\n" + "="*70)
-    print(f"  BANDIT SECURITY SCAN REPORT - {repo_name}")
-    print("="*70)
+    rule = "="*70
+    parts = [f"\n{rule}\n  BANDIT SECURITY SCAN REPORT - {repo_name}\n{rule}\n"]
     
     if "error" in scan_results:
-        print(f"\n❌ Scan Error: {scan_results['error']}")
+        parts.append(f"\n❌ Scan Error: {scan_results['error']}\n")
         if "details" in scan_results:
-            print(f"Details: {scan_results['details']}")
+            parts.append(f"Details: {scan_results['details']}\n")
+        sys.stdout.write("".join(parts))
         return
     
-    print(f"\n� Scanner: {scan_results.get('scanner', 'Bandit')}")
-    print(f"📊 Lines of Code Scanned: {scan_results.get('total_lines_scanned', 0)}")
-    print(f"� Total Issues Found: {scan_results['total_issues']}")
-    
     severity = scan_results['severity_counts']
-    print(f"\n� Severity Breakdown:")
-    print(f"   High:     {severity['high']}")
-    print(f"   Medium:   {severity['medium']}")
-    print(f"   Low:      {severity['low']}")
+    parts.append(
+        f"\n� Scanner: {scan_results.get('scanner', 'Bandit')}\n"
+        f"📊 Lines of Code Scanned: {scan_results.get('total_lines_scanned', 0)}\n"
+        f"� Total Issues Found: {scan_results['total_issues']}\n"
+        f"\n� Severity Breakdown:\n"
+        f"   High:     {severity['high']}\n"
+        f"   Medium:   {severity['medium']}\n"
+        f"   Low:      {severity['low']}\n"
+    )
     
     if scan_results['total_issues'] > 0:
-        print(f"\n📋 Issue Details:")
+        parts.append(f"\n📋 Issue Details:\n")
         for idx, issue in enumerate(scan_results['issues'][:15], 1):  # Show first 15
-            print(f"\n  {idx}. [{issue['severity'].upper()}] {issue['title']}")
-            print(f"     File: {issue['file']}")
-            print(f"     Line: {issue['line_number']}")
-            print(f"     Confidence: {issue['confidence'].upper()}")
-            print(f"     Test: {issue['test_id']} - {issue['test_name']}")
+            parts.append(
+                f"\n  {idx}. [{issue['severity'].upper()}] {issue['title']}\n"
+                f"     File: {issue['file']}\n"
+                f"     Line: {issue['line_number']}\n"
+                f"     Confidence: {issue['confidence'].upper()}\n"
+                f"     Test: {issue['test_id']} - {issue['test_name']}\n"
+            )
             if issue.get('cwe') and issue['cwe'] != 'N/A':
-                print(f"     CWE: {issue['cwe']}")
+                parts.append(f"     CWE: {issue['cwe']}\n")
         
         if len(scan_results['issues']) > 15:
-            print(f"\n  ... and {len(scan_results['issues']) - 15} more issues")
+            parts.append(f"\n  ... and {len(scan_results['issues']) - 15} more issues\n")
     
     # Final verdict
-    print("\n" + "="*70)
+    parts.append(f"\n{rule}\n")
     if scan_results['ok']:
-        print("✅ SCAN PASSED: No security issues found!")
+        parts.append("✅ SCAN PASSED: No security issues found!\n")
     else:
-        print("❌ SCAN FAILED: Security issues detected!")
-        print("   Review issues above and remediate before deployment.")
-    print("="*70 + "\n")
+        parts.append("❌ SCAN FAILED: Security issues detected!\n   Review issues above and remediate before deployment.\n")
+    parts.append(f"{rule}\n\n")
+    # One write instead of a syscall per line
+    sys.stdout.write("".join(parts))
 
 
 def validate_environment() -> bool:
@@ -456,12 +805,13 @@ def validate_environment() -> bool:
     return True
 
 
-def get_user_choice(mcp_servers: List[Dict]) -> Optional[Dict]:
+def get_user_choice(mcp_servers: List[Dict], s3_handler: S3Handler) -> Optional[Dict]:
     """
     Get user's choice of MCP server to scan
     
     Args:
         mcp_servers: List of available MCP servers
+        s3_handler: Handler used to list and look up servers
         
     Returns:
         Selected MCP server configuration or None
@@ -482,7 +832,6 @@ def get_user_choice(mcp_servers: List[Dict]) -> Optional[Dict]:
             return None
         
         if user_input.lower() == 'list':
-            s3_handler = S3Handler(AWS_ACCESS_KEY, AWS_SECRET_KEY, AWS_REGION)
             s3_handler.list_available_mcps(mcp_servers)
             continue
         
@@ -491,7 +840,6 @@ def get_user_choice(mcp_servers: List[Dict]) -> Optional[Dict]:
             continue
         
         # Search for the MCP server
-        s3_handler = S3Handler(AWS_ACCESS_KEY, AWS_SECRET_KEY, AWS_REGION)
         selected_mcp = s3_handler.find_mcp_by_name(mcp_servers, user_input)
         
         if selected_mcp:
@@ -532,7 +880,7 @@ def main():
     print(f"✓ Found {len(mcp_servers)} MCP server(s) in configuration")
     
     # 5. Let user select which MCP server to scan
-    selected_mcp = get_user_choice(mcp_servers)
+    selected_mcp = get_user_choice(mcp_servers, s3_handler)
     if not selected_mcp:
         sys.exit(0)  # User chose to quit
     
@@ -550,14 +898,26 @@ def main():
     print(f"✓ Description: {selected_mcp.get('description', 'No description')}")
     
     # 7. Clone repository to temp directory
-    temp_dir = tempfile.mkdtemp(prefix=f"bandit_scan_{repo_name}_")
+    temp_dir = tempfile.mkdtemp(prefix=f"bandit_scan_{repo_name}_", dir=MCP_SCAN_TMPDIR)
     
     try:
-        if not GitHandler.clone_repository(repo_url, temp_dir, GITHUB_TOKEN):
+        # Bandit's startup cost is paid while the clone waits on the network
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            pool.submit(_warm_bandit)
+            commit_sha = GitHandler.clone_repository(repo_url, temp_dir, GITHUB_TOKEN)
+        if commit_sha is None:
             sys.exit(1)
         
-        # 8. Run Bandit security scan
-        scan_results = bandit_scanner.scan_repository(temp_dir)
+        # 8. Run Bandit security scan, reusing the result for a commit already scanned with this Bandit
+        if _scan_cache is not None:
+            scan_results, hit = _scan_cache.cached_scan(
+                'bandit-report', commit_sha, _scan_cache.tool_version('bandit'),
+                bandit_scanner.scan_repository, temp_dir
+            )
+            if hit:
+                print(f"♻️  Reusing cached Bandit result for commit {commit_sha[:12]}")
+        else:
+            scan_results = bandit_scanner.scan_repository(temp_dir)
         
         # 9. Display results
         print_scan_report(scan_results, repo_name)
@@ -571,7 +931,7 @@ def main():
     finally:
         # 11. Cleanup
         print(f"\n[Cleanup] Removing temporary directory: {temp_dir}")
-        shutil.rmtree(temp_dir, ignore_errors=True)
+        _remove_tree(temp_dir)
 
 
 if __name__ == "__main__":
@@ -1,64 +1,70 @@
 #!/usr/bin/env python3
 
 import click
+import contextlib
+import functools
+import logging
+import orjson
 import os
+import re
+import shutil
 import sys
-import platform
+import tempfile
+from datetime import datetime
 from pathlib import Path
-from . import sonarqube
-from . import s3_handler
-from . import tool_discovery
-from . import ggshield
-from . import bandit
+from ._repo import extract_repo_name
+from . import _env
 
-def create_security_report(repo_name, repo_url, sonarqube_data, ggshield_result, bandit_result):
+_BAR70 = "=" * 70
+_BAR50 = "=" * 50
+_RULE70 = "-" * 70
+
+def create_security_report(repo_name, repo_url, sonarqube_data, ggshield_result, bandit_result, scan_date=None):
     """Create a unified security report combining all scanner results"""
-    from datetime import datetime
+    issue_counts = sonarqube_data.get('issue_counts') or {}
+    quality_ratings = sonarqube_data.get('quality_ratings') or {}
+    metrics = sonarqube_data.get('metrics') or {}
+    
+    sonar_issues = issue_counts.get('total', 0)
+    secrets = ggshield_result.get('total_secrets', 0)
+    bandit_issues = bandit_result.get('total_issues', 0)
     
     unified_report = {
         "metadata": {
             "repository": repo_name,
             "repo_url": repo_url,
-            "scan_date": datetime.now().isoformat(),
+            "scan_date": scan_date or datetime.now().isoformat(),
             "scanners_used": ["SonarQube/SonarCloud", "GitGuardian ggshield", "Bandit"]
         },
         "summary": {
-            "total_issues_all_scanners": (
-                sonarqube_data.get('issue_counts', {}).get('total', 0) +
-                ggshield_result.get('total_secrets', 0) +
-                bandit_result.get('total_issues', 0)
-            ),
+            "total_issues_all_scanners": sonar_issues + secrets + bandit_issues,
             "critical_issues": 0,
-            "sonarcloud_url": sonarqube_data.get('metadata', {}).get('sonarcloud_url', ''),
-            "scan_passed": (
-                sonarqube_data.get('issue_counts', {}).get('total', 0) == 0 and
-                ggshield_result.get('total_secrets', 0) == 0 and
-                bandit_result.get('total_issues', 0) == 0
-            )
+            "sonarcloud_url": (sonarqube_data.get('metadata') or {}).get('sonarcloud_url', ''),
+            "scan_passed": sonar_issues == 0 and secrets == 0 and bandit_issues == 0
         },
         "sonarqube": {
-            "total_issues": sonarqube_data.get('issue_counts', {}).get('total', 0),
-            "bugs": sonarqube_data.get('issue_counts', {}).get('bugs', 0),
-            "vulnerabilities": sonarqube_data.get('issue_counts', {}).get('vulnerabilities', 0),
-            "code_smells": sonarqube_data.get('issue_counts', {}).get('code_smells', 0),
-            "security_hotspots": sonarqube_data.get('issue_counts', {}).get('security_hotspots', 0),
-            "quality_gate": sonarqube_data.get('quality_gate', {}).get('status', 'N/A'),
-            "reliability_rating": sonarqube_data.get('quality_ratings', {}).get('reliability', 'N/A'),
-            "security_rating": sonarqube_data.get('quality_ratings', {}).get('security', 'N/A'),
-            "maintainability_rating": sonarqube_data.get('quality_ratings', {}).get('maintainability', 'N/A'),
-            "coverage": sonarqube_data.get('metrics', {}).get('coverage', 0),
-            "duplications": sonarqube_data.get('metrics', {}).get('duplicated_lines_density', 0),
-            "lines_of_code": sonarqube_data.get('metrics', {}).get('ncloc', 0)
+            "total_issues": sonar_issues,
+            "bugs": issue_counts.get('bugs', 0),
+            "vulnerabilities": issue_counts.get('vulnerabilities', 0),
+            "code_smells": issue_counts.get('code_smells', 0),
+            "security_hotspots": issue_counts.get('security_hotspots', 0),
+            "quality_gate": (sonarqube_data.get('quality_gate') or {}).get('status', 'N/A'),
+            "reliability_rating": quality_ratings.get('reliability', 'N/A'),
+            "security_rating": quality_ratings.get('security', 'N/A'),
+            "maintainability_rating": quality_ratings.get('maintainability', 'N/A'),
+            "coverage": metrics.get('coverage', 0),
+            "duplications": metrics.get('duplicated_lines_density', 0),
+            "lines_of_code": metrics.get('ncloc', 0)
         },
         "gitguardian": {
             "scan_passed": ggshield_result.get('success', False),
-            "total_secrets": ggshield_result.get('total_secrets', 0),
+            "total_secrets": secrets,
             "secrets": ggshield_result.get('secrets', []),
             "error": ggshield_result.get('error')
         },
         "bandit": {
             "scan_passed": bandit_result.get('success', False),
-            "total_issues": bandit_result.get('total_issues', 0),
+            "total_issues": bandit_issues,
             "severity_counts": bandit_result.get('severity_counts', {}),
             "total_lines_scanned": bandit_result.get('total_lines_scanned', 0),
             "issues": bandit_result.get('issues', []),
@@ -67,93 +73,145 @@ def create_security_report(repo_name, repo_url, sonarqube_data, ggshield_result,
         "recommendations": []
     }
     
-    sonar_issues = sonarqube_data.get('issue_counts', {}).get('total', 0)
-    secrets = ggshield_result.get('total_secrets', 0)
-    bandit_issues = bandit_result.get('total_issues', 0)
-    high_severity = bandit_result.get('severity_counts', {}).get('high', 0)
-    coverage = sonarqube_data.get('metrics', {}).get('coverage', 0)
+    high_severity = (bandit_result.get('severity_counts') or {}).get('high', 0)
+    coverage = unified_report["sonarqube"]["coverage"]
     
     try:
         coverage = float(coverage) if coverage else 0
     except (ValueError, TypeError):
         coverage = 0
     
-    if sonar_issues > 5 or secrets > 0 or high_severity > 0:
-        unified_report["recommendations"].append("Critical security issues found - immediate action required")
-    if secrets > 0:
-        unified_report["recommendations"].append("Secrets detected - rotate credentials immediately")
-    if bandit_issues > 0:
-        unified_report["recommendations"].append("Security vulnerabilities found - review and fix")
-    if high_severity > 0:
-        unified_report["recommendations"].append("High-severity issues detected - prioritize fixes")
-    if coverage < 80:
-        unified_report["recommendations"].append("Code coverage below 80% - add more tests")
-    if len(unified_report["recommendations"]) == 0:
-        unified_report["recommendations"].append("All security scans passed - good job!")
+    rules = (
+        (sonar_issues > 5 or secrets > 0 or high_severity > 0, "Critical security issues found - immediate action required"),
+        (secrets > 0, "Secrets detected - rotate credentials immediately"),
+        (bandit_issues > 0, "Security vulnerabilities found - review and fix"),
+        (high_severity > 0, "High-severity issues detected - prioritize fixes"),
+        (coverage < 80, "Code coverage below 80% - add more tests"),
+    )
+    unified_report["recommendations"] = (
+        [message for applies, message in rules if applies]
+        or ["All security scans passed - good job!"]
+    )
     
     return unified_report
 
 def print_security_summary(security_report):
     """Print a summary of the security report"""
-    click.echo("\n" + "=" * 70)
-    click.echo("📊 SECURITY SCAN SUMMARY")
-    click.echo("=" * 70)
+    sonar = security_report['sonarqube']
+    gitguardian = security_report['gitguardian']
+    bandit_report = security_report['bandit']
+    
+    lines = [
+        "\n" + _BAR70,
+        "📊 SECURITY SCAN SUMMARY",
+        _BAR70,
+    ]
     
     total_issues = security_report['summary']['total_issues_all_scanners']
     if total_issues == 0:
-        click.echo("\n🎯 Overall Status: ✅ ALL SCANS PASSED")
+        lines.append("\n🎯 Overall Status: ✅ ALL SCANS PASSED")
     else:
-        click.echo(f"\n🎯 Overall Status: ⚠️  {total_issues} TOTAL ISSUES FOUND")
-    
-    click.echo("\n" + "-" * 70)
-    click.echo("📋 Scanner Breakdown:")
-    click.echo("-" * 70)
-    
-    click.echo("\n1️⃣  SonarQube/SonarCloud:")
-    click.echo(f"   Total Issues: {security_report['sonarqube']['total_issues']}")
-    click.echo(f"   🐛 Bugs: {security_report['sonarqube']['bugs']}")
-    click.echo(f"   🔒 Vulnerabilities: {security_report['sonarqube']['vulnerabilities']}")
-    click.echo(f"   💨 Code Smells: {security_report['sonarqube']['code_smells']}")
-    click.echo(f"   🔐 Security Hotspots: {security_report['sonarqube']['security_hotspots']}")
-    
-    click.echo("\n2️⃣  GitGuardian (ggshield):")
-    if security_report['gitguardian']['scan_passed']:
-        click.echo("   ✅ No secrets detected")
+        lines.append(f"\n🎯 Overall Status: ⚠️  {total_issues} TOTAL ISSUES FOUND")
+    
+    lines += [
+        "\n" + _RULE70,
+        "📋 Scanner Breakdown:",
+        _RULE70,
+        "\n1️⃣  SonarQube/SonarCloud:",
+        f"   Total Issues: {sonar['total_issues']}",
+        f"   🐛 Bugs: {sonar['bugs']}",
+        f"   🔒 Vulnerabilities: {sonar['vulnerabilities']}",
+        f"   💨 Code Smells: {sonar['code_smells']}",
+        f"   🔐 Security Hotspots: {sonar['security_hotspots']}",
+        "\n2️⃣  GitGuardian (ggshield):",
+    ]
+    if gitguardian['scan_passed']:
+        lines.append("   ✅ No secrets detected")
     else:
-        secrets = security_report['gitguardian']['total_secrets']
-        click.echo(f"   ⚠️  {secrets} secret(s) found")
-        if security_report['gitguardian']['error']:
-            click.echo(f"   Error: {security_report['gitguardian']['error']}")
-    
-    click.echo("\n3️⃣  Bandit (Python Security):")
-    if security_report['bandit']['scan_passed']:
-        click.echo("   ✅ No security issues detected")
+        lines.append(f"   ⚠️  {gitguardian['total_secrets']} secret(s) found")
+        if gitguardian['error']:
+            lines.append(f"   Error: {gitguardian['error']}")
+    
+    lines.append("\n3️⃣  Bandit (Python Security):")
+    if bandit_report['scan_passed']:
+        lines.append("   ✅ No security issues detected")
     else:
-        issues = security_report['bandit']['total_issues']
-        severity = security_report['bandit']['severity_counts']
-        click.echo(f"   ⚠️  {issues} issue(s) found")
-        click.echo(f"   High: {severity.get('high', 0)} | Medium: {severity.get('medium', 0)} | Low: {severity.get('low', 0)}")
-    
-    click.echo("\n" + "-" * 70)
-    click.echo("💡 Recommendations:")
-    click.echo("-" * 70)
-    for rec in security_report['recommendations']:
-        click.echo(f"   {rec}")
-    
-    click.echo("\n" + "=" * 70 + "\n")
+        severity = bandit_report['severity_counts']
+        lines.append(f"   ⚠️  {bandit_report['total_issues']} issue(s) found")
+        lines.append(f"   High: {severity.get('high', 0)} | Medium: {severity.get('medium', 0)} | Low: {severity.get('low', 0)}")
+    
+    lines += [
+        "\n" + _RULE70,
+        "💡 Recommendations:",
+        _RULE70,
+    ]
+    lines.extend(f"   {rec}" for rec in security_report['recommendations'])
+    lines.append("\n" + _BAR70 + "\n")
+    
+    # One write for the whole block instead of one per line
+    click.echo("\n".join(lines))
+
+_VSCODE_MCP_PATHS = {
+    "Darwin": "Library/Application Support/Code/User/mcp.json",
+    "Windows": "AppData/Roaming/Code/User/mcp.json",
+    "Linux": ".config/Code/User/mcp.json",
+}
 
+@functools.lru_cache(maxsize=None)
 def get_vscode_mcp_path():
     """Get VS Code mcp.json path based on operating system"""
+    import platform
     system = platform.system()
     
-    if system == "Darwin":
-        return Path.home() / "Library/Application Support/Code/User/mcp.json"
-    elif system == "Windows":
-        return Path.home() / "AppData/Roaming/Code/User/mcp.json"
-    elif system == "Linux":
-        return Path.home() / ".config/Code/User/mcp.json"
-    else:
+    suffix = _VSCODE_MCP_PATHS.get(system)
+    if suffix is None:
         raise ValueError(f"Unsupported operating system: {system}")
+    return Path.home() / suffix
+
+_LEADING_INDENT_RE = re.compile(rb'^(?:  )+', re.MULTILINE)
+
+def _atomic_write(path, data):
+    """Write bytes to a sibling temp file and rename it over path so readers never see a partial file"""
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+def _tab_indent(data):
+    """Turn orjson's two-space indentation into tabs (strings never contain raw newlines, so only indentation matches)"""
+    return _LEADING_INDENT_RE.sub(lambda m: b'\t' * (len(m.group(0)) // 2), data)
+
+def _load_answers(answers_file):
+    """Load a JSON answers file (mcphub.json layout) used instead of interactive prompts"""
+    try:
+        with open(answers_file, 'rb') as f:
+            answers = orjson.loads(f.read())
+    except orjson.JSONDecodeError as e:
+        click.echo(f"❌ Error: {answers_file} is not valid JSON: {e}")
+        sys.exit(1)
+    if not isinstance(answers, dict):
+        click.echo(f"❌ Error: {answers_file} must contain a JSON object")
+        sys.exit(1)
+    return answers
+
+@contextlib.contextmanager
+def _echo_logs(logger):
+    """Print a module logger's INFO progress to stdout, indented like the rest of the command output"""
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("   %(message)s"))
+    level = logger.level
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    try:
+        yield
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(level)
+
+def _ask(answers, key, text, **kwargs):
+    """Return the answer for key when an answers file was given, otherwise prompt for it"""
+    if answers is None:
+        return click.prompt(text, **kwargs)
+    return answers.get(key, kwargs.get('default', ''))
 
 @click.group()
 @click.version_option(version='1.0.0', prog_name='mcphub')
@@ -164,93 +222,102 @@ def cli():
 @cli.command()
 @click.option('--name', required=True, help='Name of the MCP server to search')
 @click.option('--bucket', help='S3 bucket name (default: from S3_BUCKET_NAME env var)')
-def search(name, bucket):
+@click.option('--debug', is_flag=True, envvar='MCPHUB_DEBUG', help='Print the full traceback on errors')
+@click.option('--json', 'as_json', is_flag=True, help='Print compact JSON to stdout without banners')
+def search(name, bucket, debug, as_json):
     """Search for a server in S3 and display its JSON details"""
-    import json
-    
-    env_path = Path.cwd() / ".env"
-    if not env_path.exists():
-        click.echo("❌ Error: .env file not found in current directory")
-        sys.exit(1)
+    from . import s3_handler
     
-    if not bucket:
-        sonarqube.load_env_file(env_path)
-        bucket = os.environ.get('S3_BUCKET_NAME') or os.environ.get('AWS_BUCKET')
-        if not bucket:
-            click.echo("❌ Error: S3_BUCKET_NAME not found in .env file or --bucket option")
-            sys.exit(1)
+    bucket = _env.require(bucket)
     
-    click.echo(f"\n🔍 Searching for server '{name}' in S3 bucket '{bucket}'...\n")
+    if not as_json:
+        click.echo(f"\n🔍 Searching for server '{name}' in S3 bucket '{bucket}'...\n")
     
     try:
-        mcp_data = s3_handler.get_mcp_json(bucket)
-        servers = mcp_data.get('servers', [])
-        
-        server = None
-        for s in servers:
-            if s.get('name') == name:
-                server = s
-                break
+        server, names = s3_handler.find_server(bucket, name)
         
         if not server:
-            click.echo(f"❌ Server '{name}' not found in S3 bucket")
-            click.echo(f"\n💡 Available servers ({len(servers)} total):")
-            for s in servers:
-                click.echo(f"   • {s.get('name')}")
+            click.echo(f"❌ Server '{name}' not found in S3 bucket", err=as_json)
+            if as_json:
+                sys.exit(1)
+            click.echo(f"\n💡 Available servers ({len(names)} total):")
+            if names:
+                click.echo("\n".join(f"   • {server_name}" for server_name in names))
             sys.exit(1)
         
-        click.echo("=" * 70)
-        click.echo(f"✅ Found: {name}")
-        click.echo("=" * 70)
-        click.echo("\n📄 Server Details (JSON):\n")
-        click.echo(json.dumps(server, indent=2))
-        click.echo("\n" + "=" * 70)
+        if as_json:
+            sys.stdout.buffer.write(orjson.dumps(server) + b"\n")
+            return
+        
+        click.echo(
+            f"{_BAR70}\n"
+            f"✅ Found: {name}\n"
+            f"{_BAR70}\n"
+            "\n📄 Server Details (JSON):\n\n"
+            f"{orjson.dumps(server, option=orjson.OPT_INDENT_2).decode()}\n"
+            f"\n{_BAR70}"
+        )
         
     except Exception as e:
-        click.echo(f"\n❌ Error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        click.echo(f"\n❌ Error: {str(e)}", err=as_json)
+        if debug:
+            import traceback
+            traceback.print_exc()
         sys.exit(1)
 
 @cli.command()
-def init():
+@click.option('--answers', 'answers_file', type=click.Path(exists=True, dir_okay=False),
+              help='JSON file in mcphub.json layout that answers all prompts')
+@click.option('--force', is_flag=True, help='Overwrite an existing mcphub.json without asking')
+def init(answers_file, force):
     """Initialize mcphub.json configuration file"""
-    import json
-    from datetime import datetime
+    answers = _load_answers(answers_file) if answers_file else None
     
-    config_file = Path.cwd() / "mcphub.json"
+    cwd = Path.cwd()
+    config_file = cwd / "mcphub.json"
     
     if config_file.exists():
         click.echo(f"⚠️  mcphub.json already exists")
-        if not click.confirm("Do you want to overwrite it?"):
+        if force:
+            click.echo("✅ Force flag set, will overwrite existing mcphub.json")
+        elif answers is not None:
+            # An answers file means nobody is there to confirm
+            click.echo("❌ Error: mcphub.json already exists; pass --force to overwrite it")
+            sys.exit(1)
+        elif not click.confirm("Do you want to overwrite it?"):
             click.echo("❌ Aborted")
             sys.exit(0)
     
     click.echo("\n📝 Initialize MCP Server Configuration")
-    click.echo("=" * 50)
+    click.echo(_BAR50)
     
-    repo_url = click.prompt("\n🔗 Repository URL (GitHub)", default="")
+    if answers is None:
+        repo_url = click.prompt("\n🔗 Repository URL (GitHub)", default="")
+    else:
+        repo_url = (answers.get('repository') or {}).get('url', '')
     if repo_url:
-        from . import sonarqube as sq
-        owner, repo = sq.extract_repo_name(repo_url)
+        owner, repo = extract_repo_name(repo_url)
         default_name = repo if repo else ""
     else:
-        default_name = Path.cwd().name
+        default_name = cwd.name
         owner = ""
         repo = ""
     
-    name = click.prompt("📦 Server name", default=default_name)
-    version = click.prompt("🏷️  Version", default="1.0.0")
-    description = click.prompt("📄 Description", default=f"MCP server for {name}")
-    author = click.prompt("👤 Author", default="")
-    lang = click.prompt("💻 Language", default="Python")
-    license_type = click.prompt("📜 License", default="MIT")
-    entrypoint = click.prompt("🚪 Entrypoint file", default="main.py")
+    name = _ask(answers, 'name', "📦 Server name", default=default_name)
+    version = _ask(answers, 'version', "🏷️  Version", default="1.0.0")
+    description = _ask(answers, 'description', "📄 Description", default=f"MCP server for {name}")
+    author = _ask(answers, 'author', "👤 Author", default="")
+    lang = _ask(answers, 'lang', "💻 Language", default="Python")
+    license_type = _ask(answers, 'license', "📜 License", default="MIT")
+    entrypoint = _ask(answers, 'entrypoint', "🚪 Entrypoint file", default="main.py")
     
-    if not repo_url:
+    if not repo_url and answers is None:
         repo_url = click.prompt("🔗 Repository URL", default="")
     
-    add_pricing = click.confirm("\n💰 Add pricing information?", default=False)
+    if answers is None:
+        add_pricing = click.confirm("\n💰 Add pricing information?", default=False)
+    else:
+        add_pricing = 'pricing' in answers
     
     config = {
         "name": name,
@@ -267,39 +334,62 @@ def init():
     }
     
     if add_pricing:
-        currency = click.prompt("💵 Currency", default="USD")
-        amount = click.prompt("💲 Amount", type=float, default=0.0)
+        pricing = answers['pricing'] if answers is not None else None
+        if pricing is not None and not isinstance(pricing, dict):
+            click.echo(f"❌ Error: 'pricing' in {answers_file} must be a JSON object")
+            sys.exit(1)
+        currency = _ask(pricing, 'currency', "💵 Currency", default="USD")
+        # click.prompt already validates typed input; answers file values are checked here
+        try:
+            amount = float(_ask(pricing, 'amount', "💲 Amount", type=float, default=0.0))
+        except (TypeError, ValueError):
+            click.echo(f"❌ Error: pricing amount in {answers_file} must be a number, got {pricing.get('amount')!r}")
+            sys.exit(1)
         config["pricing"] = {
             "currency": currency,
             "amount": amount
         }
     
-    with open(config_file, 'w') as f:
-        json.dump(config, f, indent=2)
-    
-    click.echo("\n" + "=" * 50)
-    click.echo("✅ Configuration saved!")
-    click.echo("=" * 50)
-    click.echo(f"\n📁 Created: {config_file}")
-    click.echo("\n💡 Next steps:")
-    click.echo(f"   1. mcphub push --name {name}")
-    click.echo(f"   2. mcphub pull --name {name}")
+    _atomic_write(config_file, orjson.dumps(config, option=orjson.OPT_INDENT_2))
+    
+    click.echo(
+        f"\n{_BAR50}\n"
+        "✅ Configuration saved!\n"
+        f"{_BAR50}\n"
+        f"\n📁 Created: {config_file}\n"
+        "\n💡 Next steps:\n"
+        f"   1. mcphub push --name {name}\n"
+        f"   2. mcphub pull --name {name}"
+    )
 
 @cli.command()
 @click.option('--name', help='Name of the MCP server (reads from mcphub.json if not provided)')
 @click.option('--bucket', help='S3 bucket name (default: from AWS_BUCKET env var)')
 @click.option('--force', is_flag=True, help='Skip confirmation if server exists')
-def push(name, bucket, force):
+@click.option('--answers', 'answers_file', type=click.Path(exists=True, dir_okay=False),
+              help='JSON file in mcphub.json layout used instead of mcphub.json and prompts')
+@click.option('--debug', is_flag=True, envvar='MCPHUB_DEBUG', help='Print the full traceback on errors')
+def push(name, bucket, force, answers_file, debug):
     """Push server to S3 with SonarQube analysis"""
-    import json
+    from concurrent.futures import ThreadPoolExecutor
+    from . import sonarqube, s3_handler, tool_discovery, ggshield, bandit, _scan_cache
     
-    config_file = Path.cwd() / "mcphub.json"
+    cwd = Path.cwd()
+    config_file = cwd / "mcphub.json"
     config = None
+    config_name = Path(answers_file).name if answers_file else config_file.name
     
-    if config_file.exists():
-        with open(config_file, 'r') as f:
-            config = json.load(f)
-        click.echo(f"📄 Found mcphub.json configuration")
+    if answers_file:
+        config = _load_answers(answers_file)
+    else:
+        try:
+            with open(config_file, 'rb') as f:
+                config = orjson.loads(f.read())
+        except FileNotFoundError:
+            pass
+    
+    if config is not None:
+        click.echo(f"📄 Found {config_name} configuration")
         if not name:
             name = config.get('name')
             click.echo(f"📦 Using name from config: {name}")
@@ -308,41 +398,21 @@ def push(name, bucket, force):
         click.echo("❌ Error: --name required (or create mcphub.json with 'mcphub init')")
         sys.exit(1)
     
-    env_path = Path.cwd() / ".env"
-    if not env_path.exists():
-        click.echo("❌ Error: .env file not found in current directory")
-        click.echo("\nCreate a .env file with:")
-        click.echo("  SONAR_TOKEN=your_token_here")
-        click.echo("  SONAR_ORGANIZATION=your_org_here")
-        click.echo("  AWS_BUCKET=your_bucket_name")
-        sys.exit(1)
+    env_path = cwd / ".env"
+    bucket = _env.require(bucket, hint=(
+        "\nCreate a .env file with:\n"
+        "  SONAR_TOKEN=your_token_here\n"
+        "  SONAR_ORGANIZATION=your_org_here\n"
+        "  AWS_BUCKET=your_bucket_name"
+    ))
     
-    if not bucket:
-        sonarqube.load_env_file(env_path)
-        bucket = os.environ.get('S3_BUCKET_NAME') or os.environ.get('AWS_BUCKET')
-        if not bucket:
-            click.echo("❌ Error: S3_BUCKET_NAME not found in .env file or --bucket option")
-            sys.exit(1)
-    
-    click.echo(f"\n🔍 Checking if server '{name}' exists in S3 bucket '{bucket}'...")
-    
-    try:
-        exists, mcp_data = s3_handler.check_server_exists(bucket, name)
-        
-        if exists:
-            click.echo(f"⚠️  Server '{name}' already exists in mcp.json")
-            if not force and not click.confirm("Do you want to overwrite it?"):
-                click.echo("❌ Aborted")
-                sys.exit(0)
-            if force:
-                click.echo("✅ Force flag set, will overwrite existing server")
-    except Exception as e:
-        click.echo(f"⚠️  Could not check S3 bucket: {str(e)}")
-        if not click.confirm("Continue anyway?"):
-            sys.exit(1)
+    # Run the S3 lookup in the background while the configuration is read or prompted for
+    executor = ThreadPoolExecutor(max_workers=1)
+    s3_check = executor.submit(s3_handler.check_server_exists, bucket, name)
+    executor.shutdown(wait=False)
     
     if config:
-        click.echo(f"\n📝 Using configuration from mcphub.json:")
+        click.echo(f"\n📝 Using configuration from {config_name}:")
         version = config.get('version', '1.0.0')
         description = config.get('description', '')
         author = config.get('author', '')
@@ -351,10 +421,12 @@ def push(name, bucket, force):
         entrypoint = config.get('entrypoint', 'main.py')
         repo_url = config.get('repository', {}).get('url', '')
         
-        click.echo(f"   Version: {version}")
-        click.echo(f"   Description: {description}")
-        click.echo(f"   Author: {author}")
-        click.echo(f"   Repository: {repo_url}")
+        click.echo(
+            f"   Version: {version}\n"
+            f"   Description: {description}\n"
+            f"   Author: {author}\n"
+            f"   Repository: {repo_url}"
+        )
     else:
         click.echo(f"\n📝 Please provide information for server '{name}':")
         
@@ -366,76 +438,121 @@ def push(name, bucket, force):
         entrypoint = click.prompt("Entrypoint file", default="main.py")
         repo_url = click.prompt("Repository URL (GitHub)")
     
-    click.echo(f"\n🚀 Starting SonarQube analysis for {repo_url}...")
+    click.echo(f"\n🔍 Checking if server '{name}' exists in S3 bucket '{bucket}'...")
     
+    # Without a successful check, add_server_to_mcp reads mcp.json itself
+    mcp_data = None
     try:
-        result = sonarqube.run_analysis(repo_url, env_path)
+        exists, mcp_data = s3_check.result()
         
-        if not result['success']:
-            click.echo("❌ Analysis failed")
+        if exists:
+            click.echo(f"⚠️  Server '{name}' already exists in mcp.json")
+            if not force and not click.confirm("Do you want to overwrite it?"):
+                click.echo("❌ Aborted")
+                sys.exit(0)
+            if force:
+                click.echo("✅ Force flag set, will overwrite existing server")
+    except Exception as e:
+        click.echo(f"⚠️  Could not check S3 bucket: {str(e)}")
+        if not click.confirm("Continue anyway?"):
             sys.exit(1)
+    
+    click.echo(f"\n🚀 Starting SonarQube analysis for {repo_url}...")
+    
+    try:
+        # One timestamp for the security report and the entry's created_at/updated_at
+        current_time = datetime.now().astimezone().isoformat()
         
-        report_data = result['report_data']
-        
-        click.echo("\n🔍 Discovering tools in repository...")
-        
-        import tempfile
-        import shutil
+        # A single clone feeds SonarQube, tool discovery and both security scanners
         temp_dir = tempfile.mkdtemp(prefix="mcphub_scan_")
         try:
             repo_clone_path = os.path.join(temp_dir, "repo")
-            if sonarqube.clone_repository(repo_url, repo_clone_path):
-                tool_info = tool_discovery.discover_tools_from_repo(repo_clone_path)
-                if tool_info['tool_count'] > 0:
-                    click.echo(f"   ✅ Discovered {tool_info['tool_count']} tools: {', '.join(tool_info['tool_names'][:5])}")
-                    if len(tool_info['tool_names']) > 5:
-                        click.echo(f"      ... and {len(tool_info['tool_names']) - 5} more")
-                else:
-                    click.echo("   ℹ️  No tools discovered")
-                
-                owner, repo = sonarqube.extract_repo_name(repo_url)
-                repo_name = f"{owner}_{repo}" if owner and repo else name
-                
-                click.echo("\n🔐 Running additional security scanners...")
-                
-                click.echo("\n🔒 Running GitGuardian Secret Scan...")
-                ggshield_result = ggshield.run_ggshield_scan(repo_clone_path)
-                if ggshield_result.get('success'):
-                    click.echo("   ✅ GitGuardian: No secrets detected")
-                elif 'error' in ggshield_result:
-                    click.echo(f"   ⚠️  GitGuardian: {ggshield_result['error']}")
-                else:
-                    click.echo(f"   ⚠️  GitGuardian: {ggshield_result.get('total_secrets', 0)} secret(s) detected")
-                
-                click.echo("\n🐍 Running Bandit Python Security Scan...")
-                bandit_result = bandit.run_bandit_scan(repo_clone_path)
-                if bandit_result.get('success'):
-                    click.echo("   ✅ Bandit: No security issues found")
-                elif 'error' in bandit_result:
-                    click.echo(f"   ⚠️  Bandit: {bandit_result['error']}")
-                else:
-                    click.echo(f"   ⚠️  {bandit_result.get('total_issues', 0)} security issue(s) detected")
-                    click.echo(f"   ⚠️  Bandit: {bandit_result.get('total_issues', 0)} issue(s) detected")
-                
-                click.echo("\n📊 Generating security report...")
-                security_report = create_security_report(
-                    repo_name, repo_url, 
-                    result['report_data'], 
-                    ggshield_result, 
-                    bandit_result
+            if not sonarqube.clone_repository(repo_url, repo_clone_path):
+                click.echo("❌ Failed to clone repository")
+                sys.exit(1)
+            
+            # Analysis, discovery and scan results are cached per commit, so re-pushing unchanged code skips them
+            sha = _scan_cache.head_sha(repo_clone_path)
+            # The same commit analysed under another organization is a different SonarCloud project
+            result, hit = _scan_cache.cached_scan(
+                'sonarqube', sha, f"{_scan_cache.tool_version('mcphub')}:{os.environ.get('SONAR_ORGANIZATION', '')}",
+                sonarqube.run_analysis, repo_url, env_path, repo_clone_path
+            )
+            if hit:
+                click.echo(f"   ♻️  sonarqube: reusing cached result for {sha[:12]}")
+            
+            if not result['success']:
+                click.echo("❌ Analysis failed")
+                sys.exit(1)
+            
+            report_data = result['report_data']
+            
+            click.echo("\n🔍 Discovering tools in repository...")
+            
+            tool_info, hit = _scan_cache.cached_scan(
+                'tools', sha, _scan_cache.tool_version('mcphub'),
+                tool_discovery.discover_tools_from_repo, repo_clone_path
+            )
+            if hit:
+                click.echo(f"   ♻️  tools: reusing cached result for {sha[:12]}")
+            if tool_info['tool_count'] > 0:
+                click.echo(f"   ✅ Discovered {tool_info['tool_count']} tools: {', '.join(tool_info['tool_names'][:5])}")
+                if len(tool_info['tool_names']) > 5:
+                    click.echo(f"      ... and {len(tool_info['tool_names']) - 5} more")
+            else:
+                click.echo("   ℹ️  No tools discovered")
+            
+            owner, repo = extract_repo_name(repo_url)
+            repo_name = f"{owner}_{repo}" if owner and repo else name
+            
+            click.echo("\n🔐 Running additional security scanners (GitGuardian + Bandit in parallel)...")
+            
+            # Both scanners only read the cloned tree, so they can run side by side
+            with _echo_logs(ggshield.logger), ThreadPoolExecutor(max_workers=2) as scan_pool:
+                ggshield_future = scan_pool.submit(
+                    _scan_cache.cached_scan, 'ggshield', sha, _scan_cache.tool_version('ggshield'),
+                    ggshield.run_ggshield_scan, repo_clone_path
                 )
-                
-                print_security_summary(security_report)
+                bandit_future = scan_pool.submit(
+                    _scan_cache.cached_scan, 'bandit', sha, _scan_cache.tool_version('bandit'),
+                    bandit.run_bandit_scan, repo_clone_path
+                )
+                ggshield_result, ggshield_hit = ggshield_future.result()
+                bandit_result, bandit_hit = bandit_future.result()
+            for scanner, hit in (('ggshield', ggshield_hit), ('bandit', bandit_hit)):
+                if hit:
+                    click.echo(f"   ♻️  {scanner}: reusing cached result for {sha[:12]}")
+            
+            click.echo("\n🔒 GitGuardian Secret Scan:")
+            if ggshield_result.get('success'):
+                click.echo("   ✅ GitGuardian: No secrets detected")
+            elif 'error' in ggshield_result:
+                click.echo(f"   ⚠️  GitGuardian: {ggshield_result['error']}")
+            else:
+                click.echo(f"   ⚠️  GitGuardian: {ggshield_result.get('total_secrets', 0)} secret(s) detected")
+            
+            click.echo("\n🐍 Bandit Python Security Scan:")
+            if bandit_result.get('success'):
+                click.echo("   ✅ Bandit: No security issues found")
+            elif 'error' in bandit_result:
+                click.echo(f"   ⚠️  Bandit: {bandit_result['error']}")
             else:
-                tool_info = {"tool_count": 0, "tool_names": []}
-                security_report = None
-                click.echo("   ⚠️  Could not discover tools (clone failed)")
+                click.echo(f"   ⚠️  {bandit_result.get('total_issues', 0)} security issue(s) detected")
+                click.echo(f"   ⚠️  Bandit: {bandit_result.get('total_issues', 0)} issue(s) detected")
+            
+            click.echo("\n📊 Generating security report...")
+            security_report = create_security_report(
+                repo_name, repo_url, 
+                result['report_data'], 
+                ggshield_result, 
+                bandit_result,
+                scan_date=current_time
+            )
+            
+            print_security_summary(security_report)
         finally:
             shutil.rmtree(temp_dir, ignore_errors=True)
         
-        from datetime import datetime
-        current_time = datetime.now().astimezone().isoformat()
-        
         server_entry = {
             "name": name,
             "version": version,
@@ -465,118 +582,204 @@ def push(name, bucket, force):
         
         click.echo(f"\n📤 Pushing server entry to S3 bucket '{bucket}'...")
         
-        s3_handler.add_server_to_mcp(bucket, server_entry)
+        # Inside a batch the entry is only queued; batch writes it and reports any failure
+        queued = s3_handler.writes_deferred()
+        s3_handler.add_server_to_mcp(bucket, server_entry, mcp_data)
         
-        click.echo("\n" + "=" * 70)
-        click.echo("✅ Success!")
-        click.echo("=" * 70)
-        click.echo(f"\n✅ Server '{name}' has been pushed to S3 with complete security report")
-        click.echo(f"✅ View in SonarCloud: {report_data['metadata']['sonarcloud_url']}")
-        click.echo("\n💡 All data (including security scans) is now in S3 - no local files created")
+        click.echo(
+            f"\n{_BAR70}\n"
+            "✅ Success!\n"
+            f"{_BAR70}\n"
+            f"\n✅ Server '{name}' has been {'queued for S3' if queued else 'pushed to S3'} with complete security report\n"
+            f"✅ View in SonarCloud: {report_data['metadata']['sonarcloud_url']}\n"
+            + ("\n💡 The entry is written to S3 when the batch finishes - no local files created" if queued else
+               "\n💡 All data (including security scans) is now in S3 - no local files created")
+        )
         
     except Exception as e:
         click.echo(f"\n❌ Error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        if debug:
+            import traceback
+            traceback.print_exc()
         sys.exit(1)
 
 @cli.command()
 @click.option('--name', required=True, help='Name of the MCP server to pull')
 @click.option('--bucket', help='S3 bucket name (default: from S3_BUCKET_NAME env var)')
-def pull(name, bucket):
+@click.option('--debug', is_flag=True, envvar='MCPHUB_DEBUG', help='Print the full traceback on errors')
+@click.option('--json', 'as_json', is_flag=True, help='Print compact JSON to stdout without banners')
+def pull(name, bucket, debug, as_json):
     """Pull a server from S3 and add to VS Code mcp.json"""
-    import json
-    from pathlib import Path
+    import platform
+    from . import s3_handler
     
-    env_path = Path.cwd() / ".env"
-    if not env_path.exists():
-        click.echo("❌ Error: .env file not found in current directory")
-        sys.exit(1)
+    bucket = _env.require(bucket)
     
-    if not bucket:
-        sonarqube.load_env_file(env_path)
-        bucket = os.environ.get('S3_BUCKET_NAME') or os.environ.get('AWS_BUCKET')
-        if not bucket:
-            click.echo("❌ Error: S3_BUCKET_NAME not found in .env file or --bucket option")
-            sys.exit(1)
-    
-    sonarqube.load_env_file(env_path)
     lambda_base_url = os.environ.get('LAMBDA_BASE_URL')
     if not lambda_base_url:
-        click.echo("❌ Error: LAMBDA_BASE_URL not found in .env file")
-        click.echo("Add to .env: LAMBDA_BASE_URL=https://your-lambda-url.amazonaws.com")
+        click.echo("❌ Error: LAMBDA_BASE_URL not found in .env file", err=as_json)
+        click.echo("Add to .env: LAMBDA_BASE_URL=https://your-lambda-url.amazonaws.com", err=as_json)
         sys.exit(1)
     
-    click.echo(f"\n🔍 Fetching server '{name}' from S3 bucket '{bucket}'...")
+    if not as_json:
+        click.echo(f"\n🔍 Fetching server '{name}' from S3 bucket '{bucket}'...")
     
     try:
-        mcp_data = s3_handler.get_mcp_json(bucket)
-        servers = mcp_data.get('servers', [])
-        
-        server = None
-        for s in servers:
-            if s.get('name') == name:
-                server = s
-                break
+        server, names = s3_handler.find_server(bucket, name)
         
         if not server:
-            click.echo(f"❌ Error: Server '{name}' not found in S3 bucket")
-            click.echo("\nAvailable servers:")
-            for s in servers:
-                click.echo(f"  • {s.get('name')}")
+            click.echo(f"❌ Error: Server '{name}' not found in S3 bucket", err=as_json)
+            click.echo("\nAvailable servers:", err=as_json)
+            if names:
+                click.echo("\n".join(f"  • {server_name}" for server_name in names), err=as_json)
             sys.exit(1)
         
-        click.echo(f"✅ Found server: {name}")
-        click.echo(f"   Description: {server.get('description')}")
-        click.echo(f"   Author: {server.get('author')}")
-        click.echo(f"   Repository: {server.get('repository', {}).get('url')}")
+        if not as_json:
+            click.echo(
+                f"✅ Found server: {name}\n"
+                f"   Description: {server.get('description')}\n"
+                f"   Author: {server.get('author')}\n"
+                f"   Repository: {server.get('repository', {}).get('url')}"
+            )
         
         try:
             vscode_mcp_path = get_vscode_mcp_path()
         except ValueError as e:
-            click.echo(f"❌ Error: {str(e)}")
+            click.echo(f"❌ Error: {str(e)}", err=as_json)
             sys.exit(1)
         
-        if not vscode_mcp_path.exists():
-            click.echo(f"❌ Error: VS Code mcp.json not found at {vscode_mcp_path}")
-            click.echo(f"\n💡 Expected location for {platform.system()}:")
-            click.echo(f"   {vscode_mcp_path}")
+        try:
+            with open(vscode_mcp_path, 'rb') as f:
+                vscode_mcp = orjson.loads(f.read())
+        except FileNotFoundError:
+            click.echo(f"❌ Error: VS Code mcp.json not found at {vscode_mcp_path}", err=as_json)
+            click.echo(f"\n💡 Expected location for {platform.system()}:", err=as_json)
+            click.echo(f"   {vscode_mcp_path}", err=as_json)
             sys.exit(1)
         
-        with open(vscode_mcp_path, 'r') as f:
-            vscode_mcp = json.load(f)
-        
         if 'servers' not in vscode_mcp:
             vscode_mcp['servers'] = {}
         
         server_url = f"{lambda_base_url}/{name}"
         
         if name in vscode_mcp['servers']:
-            click.echo(f"\n⚠️  Server '{name}' already exists in VS Code mcp.json")
-            if not click.confirm("Do you want to overwrite it?"):
-                click.echo("❌ Aborted")
+            click.echo(f"\n⚠️  Server '{name}' already exists in VS Code mcp.json", err=as_json)
+            if not click.confirm("Do you want to overwrite it?", err=as_json):
+                click.echo("❌ Aborted", err=as_json)
                 sys.exit(0)
         
         vscode_mcp['servers'][name] = {
             "url": server_url
         }
         
-        with open(vscode_mcp_path, 'w') as f:
-            json.dump(vscode_mcp, f, indent='\t')
+        _atomic_write(vscode_mcp_path, _tab_indent(orjson.dumps(vscode_mcp, option=orjson.OPT_INDENT_2)))
+        
+        if as_json:
+            sys.stdout.buffer.write(orjson.dumps({"name": name, "url": server_url, "path": str(vscode_mcp_path)}) + b"\n")
+            return
         
-        click.echo("\n" + "=" * 70)
-        click.echo("✅ Success!")
-        click.echo("=" * 70)
-        click.echo(f"\n✅ Server '{name}' added to VS Code mcp.json")
-        click.echo(f"✅ URL: {server_url}")
-        click.echo(f"\n📍 Location: {vscode_mcp_path}")
-        click.echo("\n💡 Restart VS Code to load the new server")
+        click.echo(
+            f"\n{_BAR70}\n"
+            "✅ Success!\n"
+            f"{_BAR70}\n"
+            f"\n✅ Server '{name}' added to VS Code mcp.json\n"
+            f"✅ URL: {server_url}\n"
+            f"\n📍 Location: {vscode_mcp_path}\n"
+            "\n💡 Restart VS Code to load the new server"
+        )
         
     except Exception as e:
-        click.echo(f"\n❌ Error: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        click.echo(f"\n❌ Error: {str(e)}", err=as_json)
+        if debug:
+            import traceback
+            traceback.print_exc()
+        sys.exit(1)
+
+# Batch entry keys that differ from the command's parameter names
+_BATCH_KEYS = {'answers': 'answers_file', 'json': 'as_json'}
+
+def _flush_batch_writes(s3_handler):
+    """Write the pushes queued so far; on an S3 error report what was not written and exit"""
+    from botocore.exceptions import ClientError
+    try:
+        s3_handler.flush_writes()
+    except ClientError as e:
+        click.echo(f"❌ Error: could not write mcp.json: {e}")
+        for bucket, names in s3_handler.drop_writes().items():
+            click.echo(f"   Not written to bucket '{bucket}': {', '.join(names)}")
+        sys.exit(1)
+
+@cli.command()
+@click.argument('file', type=click.Path(exists=True, dir_okay=False))
+@click.option('--debug', is_flag=True, envvar='MCPHUB_DEBUG', help='Print the full traceback on errors')
+@click.pass_context
+def batch(ctx, file, debug):
+    """Run a JSON list of search/push/pull operations in one process"""
+    from . import s3_handler
+    commands = {'search': search, 'push': push, 'pull': pull}
+    
+    try:
+        with open(file, 'rb') as f:
+            operations = orjson.loads(f.read())
+    except orjson.JSONDecodeError as e:
+        click.echo(f"❌ Error: {file} is not valid JSON: {e}")
         sys.exit(1)
+    if not isinstance(operations, list):
+        click.echo(f"❌ Error: {file} must contain a JSON list of operations, got {type(operations).__name__}")
+        sys.exit(1)
+    
+    # The S3 client, parsed .env and cached mcp.json are process-wide, so every
+    # operation after the first reuses them instead of paying for a new interpreter.
+    # Consecutive pushes are collected per bucket and written with one PUT.
+    with s3_handler.deferred_writes():
+        try:
+            for index, operation in enumerate(operations, 1):
+                if not isinstance(operation, dict):
+                    click.echo(f"❌ Error: operation {index} must be a JSON object, got {type(operation).__name__}")
+                    sys.exit(1)
+                op = operation.get('op')
+                command = commands.get(op)
+                if command is None:
+                    click.echo(f"❌ Error: operation {index} has unknown op '{op}' (expected search, push or pull)")
+                    sys.exit(1)
+                
+                # Turn the entry into command-line arguments so Click converts and validates them as usual
+                options = {p.name: p for p in command.params}
+                args = []
+                try:
+                    for key, value in operation.items():
+                        if key == 'op' or value is None:
+                            continue
+                        param = options.get(_BATCH_KEYS.get(key, key))
+                        if param is None:
+                            raise click.UsageError(f"unknown key '{key}' for {op}")
+                        if param.is_flag:
+                            if click.BOOL.convert(value, param, ctx):
+                                args.append(param.opts[0])
+                        else:
+                            args.extend((param.opts[0], str(value)))
+                    if debug and 'debug' not in operation:
+                        args.append('--debug')
+                    sub_ctx = command.make_context(op, args, parent=ctx)
+                except click.ClickException as e:
+                    click.echo(f"❌ Error: operation {index} ({op}): {e.format_message()}")
+                    sys.exit(1)
+                
+                if op != 'push':
+                    # search/pull read mcp.json from S3, so land the pending pushes first
+                    _flush_batch_writes(s3_handler)
+                
+                click.echo(f"\n▶️  [{index}/{len(operations)}] {op} {sub_ctx.params.get('name') or ''}".rstrip())
+                try:
+                    with sub_ctx:
+                        command.invoke(sub_ctx)
+                except SystemExit as e:
+                    if e.code:
+                        click.echo(f"❌ Batch stopped: operation {index} ({op}) failed")
+                        raise
+        finally:
+            # Pushes queued before a failed operation still land; S3 errors are reported, not raised
+            _flush_batch_writes(s3_handler)
 
 def main():
     cli()
@@ -1,18 +1,30 @@
 # ...existing code...
 import os
+import functools
+import gzip
+import hashlib
 import subprocess
 import shutil
 import tempfile
-import json
 import time
 import re
+import uuid
+import threading
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel
 import uvicorn
+import ijson
+import orjson
 
 # Optional AWS / S3
 try:
@@ -22,22 +34,31 @@ except Exception:
     boto3 = None
 
 # --- Configuration ---
+try:
+    from dotenv import load_dotenv
+except ImportError:
+    load_dotenv = None
+
+_ENV_LINE_RE = re.compile(r'^(?:export\s+)?([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(?:"(.*)"|\'(.*)\'|(.*))$')
+
 def load_env_file(env_path=None):
-    """Load environment variables from .env file"""
+    """Load environment variables from .env file; variables already set take precedence"""
     if env_path is None:
         env_path = Path.cwd() / ".env"
     else:
         env_path = Path(env_path)
     
-    if env_path.exists():
-        with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    line = line.replace('export ', '')
-                    key, value = line.split('=', 1)
-                    value = value.strip('"').strip("'")
-                    os.environ[key] = value
+    if not env_path.exists():
+        return
+    if load_dotenv is not None:
+        load_dotenv(env_path, override=False)
+        return
+    with open(env_path, 'r') as f:
+        for line in f:
+            m = _ENV_LINE_RE.match(line.strip())
+            if m:
+                key, double, single, bare = m.groups()
+                os.environ.setdefault(key, double if double is not None else single if single is not None else bare)
 
 load_env_file()
 
@@ -46,6 +67,37 @@ GITGUARDIAN_API_KEY = os.environ.get("GITGUARDIAN_API_KEY")
 MCP_S3_BUCKET = os.environ.get("S3_BUCKET_NAME")
 MCP_S3_KEY = os.environ.get("MCP_S3_KEY", "mcp.json")
 AWS_REGION = os.environ.get("AWS_REGION", "ap-south-1")
+# Seconds a cached /scan_mcp result stays valid for the same repo commit (0 disables the cache)
+MCP_SCAN_CACHE_TTL = int(os.environ.get("MCP_SCAN_CACHE_TTL", "3600"))
+MCP_SCAN_CACHE_PREFIX = "ggshield-cache/"
+# Parallel scans per /scan_mcp_batch request
+MCP_SCAN_CONCURRENCY = int(os.environ.get("MCP_SCAN_CONCURRENCY", "8"))
+# Clones running at once across all requests, so parallel scans don't split the bandwidth too thin
+MCP_CLONE_CONCURRENCY = int(os.environ.get("MCP_CLONE_CONCURRENCY", "4"))
+_clone_slots = threading.BoundedSemaphore(max(1, MCP_CLONE_CONCURRENCY))
+# Where clones are checked out; point at a tmpfs such as /dev/shm to keep scans off the disk
+MCP_SCAN_TMPDIR = os.environ.get("MCP_SCAN_TMPDIR") or tempfile.gettempdir()
+# Scan dirs are renamed here (same filesystem) and deleted in the background after the response
+_TRASH = Path(MCP_SCAN_TMPDIR) / "mcp_ggshield_trash"
+_cleanup_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mcp_cleanup")
+
+# Per-request progress is logged at INFO; set LOG_LEVEL=INFO to see it
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "WARNING").upper()
+
+logger = logging.getLogger("mcphub.ggshield")
+
+def _setup_logging():
+    """Route this module's logs through a queue so request threads never block on stdout."""
+    if any(isinstance(h, QueueHandler) for h in logger.handlers):
+        return
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, handler)
+    logger.addHandler(QueueHandler(log_queue))
+    logger.setLevel(LOG_LEVEL)
+    listener.start()
+    atexit.register(listener.stop)
 
 # FastAPI app
 app = FastAPI(title="MCP GitGuardian Scanner", version="1.0.0")
@@ -53,28 +105,78 @@ app = FastAPI(title="MCP GitGuardian Scanner", version="1.0.0")
 class MCPScanRequest(BaseModel):
     name: str
 
+class MCPBatchScanRequest(BaseModel):
+    names: List[str]
+
+_GITHUB_PREFIX_RE = re.compile(r'^(?:git@github\.com:|.*github\.com/)')
+
+@functools.lru_cache(maxsize=256)
 def extract_repo_name(repo_url):
     """Extract owner and repo name from GitHub URL"""
-    repo_url = repo_url.strip().rstrip('/')
-    if repo_url.startswith('git@github.com:'):
-        repo_url = repo_url.replace('git@github.com:', '')
-    elif 'github.com/' in repo_url:
-        repo_url = repo_url.split('github.com/')[-1]
-    repo_url = repo_url.replace('.git', '')
-    parts = repo_url.split('/')
-    if len(parts) >= 2:
-        return parts[-2], parts[-1]
-    return None, None
-
-def get_mcp_json_from_s3(bucket: str, key: str) -> dict:
-    """Fetch mcp.json from the given S3 bucket/key and return parsed JSON."""
+    path = _GITHUB_PREFIX_RE.sub('', repo_url.strip().rstrip('/'), count=1)
+    if path.endswith('.git'):
+        path = path[:-4]
+    head, sep, repo = path.rpartition('/')
+    if not sep:
+        return None, None
+    return head.rpartition('/')[2], repo
+
+@functools.lru_cache(maxsize=1)
+def get_s3_client():
+    """Create the S3 client once and reuse it across requests (clients are thread-safe)."""
+    return boto3.session.Session().client("s3", region_name=AWS_REGION)
+
+def get_remote_head_sha(repo_url: str) -> Optional[str]:
+    """Resolve the repo's HEAD commit with ls-remote, without cloning."""
+    try:
+        result = subprocess.run(
+            ["git", "ls-remote", repo_url, "HEAD"],
+            capture_output=True, text=True, timeout=30
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return None
+    if result.returncode != 0 or not result.stdout:
+        return None
+    return result.stdout.split()[0]
+
+def scan_cache_key(repo_url: str, sha: str) -> str:
+    digest = hashlib.sha256(f"{repo_url}@{sha}".encode()).hexdigest()
+    return f"{MCP_SCAN_CACHE_PREFIX}{digest}.json"
+
+def get_cached_scan(bucket: str, key: str) -> Optional[dict]:
+    """Return a cached scan response stored under key, or None if missing or expired."""
+    try:
+        resp = get_s3_client().get_object(Bucket=bucket, Key=key)
+        if float(resp.get('Metadata', {}).get('ttl', 0)) < time.time():
+            return None
+        return orjson.loads(resp['Body'].read())
+    except Exception:
+        return None
+
+def put_cached_scan(bucket: str, key: str, cached: dict):
+    """Store a scan response under key with an expiry in the object metadata."""
+    try:
+        get_s3_client().put_object(
+            Bucket=bucket,
+            Key=key,
+            Body=orjson.dumps(cached),
+            ContentType='application/json',
+            Metadata={'ttl': str(time.time() + MCP_SCAN_CACHE_TTL)}
+        )
+        logger.info("✅ Scan result cached")
+    except Exception as e:
+        logger.warning("⚠️  Could not cache scan result: %s", e)
+
+def find_server_streaming(bucket: str, key: str, name: str) -> Optional[dict]:
+    """Stream mcp.json from S3 and return the first server entry named name, without parsing the rest."""
     if boto3 is None:
         raise RuntimeError("boto3 is required to fetch mcp.json from S3. Install with: pip install boto3")
-    s3 = boto3.client("s3", region_name=AWS_REGION)
     try:
-        resp = s3.get_object(Bucket=bucket, Key=key)
-        body = resp['Body'].read().decode('utf-8')
-        return json.loads(body)
+        resp = get_s3_client().get_object(Bucket=bucket, Key=key)
+        for server in ijson.items(resp['Body'], 'servers.item', use_float=True):
+            if server.get("name") == name:
+                return server
+        return None
     except ClientError as e:
         raise RuntimeError(f"Failed to fetch {key} from bucket {bucket}: {e}")
     except BotoCoreError as e:
@@ -82,30 +184,24 @@ def get_mcp_json_from_s3(bucket: str, key: str) -> dict:
     except Exception as e:
         raise RuntimeError(f"Failed to load/parse mcp.json: {e}")
 
-def find_server_entry(mcp_json: dict, name: str) -> Optional[dict]:
-    """Find server entry by name (case-sensitive exact match)."""
-    servers = mcp_json.get("servers") or []
-    for s in servers:
-        if s.get("name") == name:
-            return s
-    return None
-
 def clone_repository(repo_url: str, target_dir: str) -> bool:
-    """Clone the repository to target_dir (shallow clone)."""
-    print(f"   Cloning from: {repo_url}")
-    result = subprocess.run(
-        ["git", "clone", "--depth", "1", repo_url, target_dir],
-        capture_output=True, text=True
-    )
+    """Clone the repository to target_dir (shallow clone of the default branch, no tags)."""
+    logger.info("Cloning from: %s", repo_url)
+    with _clone_slots:
+        result = subprocess.run(
+            ["git", "-c", "http.maxRequests=16", "clone", "--depth", "1", "--single-branch", "--no-tags",
+             repo_url, target_dir],
+            capture_output=True, text=True
+        )
     if result.returncode != 0:
-        print(f"   ❌ Clone failed: {result.stderr}")
+        logger.error("❌ Clone failed: %s", result.stderr)
         return False
-    print("   ✅ Repository cloned")
+    logger.info("✅ Repository cloned")
     return True
 
 def run_ggshield_scan(path_to_scan: str) -> dict:
     """Run ggshield scan on the given path and return structured result."""
-    print(f"   Running GitGuardian scanner on: {path_to_scan}")
+    logger.info("Running GitGuardian scanner on: %s", path_to_scan)
     if not GITGUARDIAN_API_KEY:
         return {'exit_code': 500, 'error': 'GITGUARDIAN_API_KEY not configured on server'}
     
@@ -114,16 +210,16 @@ def run_ggshield_scan(path_to_scan: str) -> dict:
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
         
         if result.returncode != 0:
-            print("   ⚠️  Scanner detected secrets!")
+            logger.warning("⚠️  Scanner detected secrets!")
         else:
-            print("   ✅ Scanner completed - No secrets found")
+            logger.info("✅ Scanner completed - No secrets found")
         
         # Try to parse JSON output
         scan_data = None
         if result.stdout:
             try:
-                scan_data = json.loads(result.stdout)
-            except json.JSONDecodeError:
+                scan_data = orjson.loads(result.stdout)
+            except orjson.JSONDecodeError:
                 pass
         
         return {
@@ -133,7 +229,7 @@ def run_ggshield_scan(path_to_scan: str) -> dict:
             'scan_data': scan_data
         }
     except subprocess.TimeoutExpired:
-        print("   ❌ Scanner timeout (>5 minutes)")
+        logger.error("❌ Scanner timeout (>5 minutes)")
         return {'exit_code': 1, 'error': 'Scanner timeout'}
     except FileNotFoundError:
         return {'exit_code': 127, 'error': 'ggshield command not found. Install with: pip install ggshield'}
@@ -148,14 +244,29 @@ def cleanup(path: str):
                 shutil.rmtree(path)
             else:
                 os.remove(path)
-            print(f"   ✅ Cleaned up: {path}")
+            logger.info("✅ Cleaned up: %s", path)
     except Exception as e:
-        print(f"   ⚠️  Cleanup warning: {e}")
+        logger.warning("⚠️  Cleanup warning: %s", e)
+
+def discard(path: str):
+    """Move a temp directory out of the way and delete it on the cleanup thread"""
+    try:
+        _TRASH.mkdir(exist_ok=True)
+        trash = _TRASH / uuid.uuid4().hex
+        os.rename(path, trash)
+    except OSError:
+        # e.g. path already gone or trash on another filesystem; delete inline
+        cleanup(path)
+        return
+    _cleanup_pool.submit(shutil.rmtree, trash, ignore_errors=True)
+    logger.info("✅ Scheduled cleanup: %s", path)
 
 def save_report(repo_name: str, project_key: str, scan_result: dict, repo_url: str, output_dir=None):
     """Save scan report to JSON file"""
-    print("   Generating report...")
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    logger.info("Generating report...")
+    # One clock read so the file name and scan_date never straddle a second boundary
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
     
     if output_dir is None:
         report_dir = Path.cwd() / "reports"
@@ -164,31 +275,30 @@ def save_report(repo_name: str, project_key: str, scan_result: dict, repo_url: s
     
     report_dir.mkdir(exist_ok=True)
     
-    # Extract secrets information
-    secrets_found = []
-    total_secrets = 0
-    
-    if scan_result.get('scan_data'):
-        scan_data = scan_result['scan_data']
-        if isinstance(scan_data, list):
-            for item in scan_data:
-                secrets = item.get('secrets', [])
-                total_secrets += len(secrets)
-                for secret in secrets:
-                    secrets_found.append({
-                        'type': secret.get('type'),
-                        'validity': secret.get('validity'),
-                        'file': item.get('filename'),
-                        'line': secret.get('start_line'),
-                        'match': secret.get('match', '')[0:50] + '...' if secret.get('match') else None
-                    })
+    # Extract secrets information; a clean scan (exit code 0) has none to walk
+    scan_data = scan_result.get('scan_data')
+    if scan_result.get('exit_code') == 0 or not isinstance(scan_data, list):
+        secrets_found = []
+    else:
+        secrets_found = [
+            {
+                'type': secret.get('type'),
+                'validity': secret.get('validity'),
+                'file': item.get('filename'),
+                'line': secret.get('start_line'),
+                'match': match[:50] + '...' if (match := secret.get('match')) else None
+            }
+            for item in scan_data
+            for secret in item.get('secrets', ())
+        ]
+    total_secrets = len(secrets_found)
     
     report = {
         "metadata": {
             "repository": repo_name,
             "repo_url": repo_url,
             "project_key": project_key,
-            "scan_date": datetime.now().isoformat(),
+            "scan_date": now.isoformat(),
             "scanner": "GitGuardian ggshield"
         },
         "summary": {
@@ -197,52 +307,81 @@ def save_report(repo_name: str, project_key: str, scan_result: dict, repo_url: s
             "exit_code": scan_result.get('exit_code')
         },
         "secrets": secrets_found,
-        "raw_output": scan_result.get('stdout')
+        "raw_output_file": None
     }
     
     report_file = report_dir / f"ggshield-scan-{repo_name}-{timestamp}.json"
-    with open(report_file, 'w') as f:
-        json.dump(report, f, indent=2)
-    print(f"   ✅ Report saved: {report_file}")
+    # ggshield's stdout is already JSON; keep it gzipped beside the report rather than embedded in it
+    raw_output = scan_result.get('stdout')
+    if raw_output:
+        raw_file = report_file.with_suffix(".raw.json.gz")
+        with gzip.open(raw_file, 'wt', encoding="utf-8", compresslevel=6) as f:
+            f.write(raw_output)
+        report["raw_output_file"] = raw_file.name
+    
+    report_file.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+    logger.info("✅ Report saved: %s", report_file)
     
+    # Point latest at the same inode; link + replace keeps concurrent scans from tearing it
     latest_file = report_dir / "latest-scan-report.json"
-    with open(latest_file, 'w') as f:
-        json.dump(report, f, indent=2)
-    print(f"   ✅ Latest report: {latest_file}")
+    tmp_link = report_dir / f".latest-{uuid.uuid4().hex}"
+    try:
+        os.link(report_file, tmp_link)
+        os.replace(tmp_link, latest_file)
+    except OSError:
+        shutil.copyfile(report_file, latest_file)
+    finally:
+        # rename is a no-op when latest already links to report_file, leaving tmp_link behind
+        if os.path.lexists(tmp_link):
+            os.unlink(tmp_link)
+    logger.info("✅ Latest report: %s", latest_file)
     
     return report_file, report
 
 def print_summary(report_data: dict):
-    """Print a summary of the scan results"""
-    print("\n" + "=" * 70)
-    print("GitGuardian Scan Summary")
-    print("=" * 70)
-    
+    """Log a summary of the scan results"""
+    if not logger.isEnabledFor(logging.INFO):
+        return
     summary = report_data["summary"]
     metadata = report_data["metadata"]
     
-    print(f"\n📦 Repository: {metadata['repository']}")
-    print(f"🔗 URL: {metadata['repo_url']}")
-    print(f"📅 Scan Date: {metadata['scan_date']}")
-    
-    print("\n🔍 Scan Results:")
+    lines = [
+        "=" * 70,
+        "GitGuardian Scan Summary",
+        "=" * 70,
+        f"📦 Repository: {metadata['repository']}",
+        f"🔗 URL: {metadata['repo_url']}",
+        f"📅 Scan Date: {metadata['scan_date']}",
+        "🔍 Scan Results:",
+    ]
     if summary['scan_passed']:
-        print("   ✅ PASSED - No secrets detected")
+        lines.append("   ✅ PASSED - No secrets detected")
     else:
-        print(f"   ❌ FAILED - {summary['total_secrets_found']} secret(s) detected")
+        lines.append(f"   ❌ FAILED - {summary['total_secrets_found']} secret(s) detected")
     
     if report_data.get('secrets'):
-        print("\n🚨 Secrets Found:")
+        lines.append("🚨 Secrets Found:")
         for i, secret in enumerate(report_data['secrets'][:10], 1):  # Show first 10
-            print(f"\n   [{i}] {secret.get('type', 'Unknown')}")
-            print(f"       File: {secret.get('file')}")
-            print(f"       Line: {secret.get('line')}")
-            print(f"       Validity: {secret.get('validity', 'Unknown')}")
+            lines.append(f"   [{i}] {secret.get('type', 'Unknown')}")
+            lines.append(f"       File: {secret.get('file')}")
+            lines.append(f"       Line: {secret.get('line')}")
+            lines.append(f"       Validity: {secret.get('validity', 'Unknown')}")
         
         if len(report_data['secrets']) > 10:
-            print(f"\n   ... and {len(report_data['secrets']) - 10} more secrets")
+            lines.append(f"   ... and {len(report_data['secrets']) - 10} more secrets")
     
-    print("\n" + "=" * 70)
+    lines.append("=" * 70)
+    logger.info("\n".join(lines))
+
+@app.on_event("startup")
+def start_logging():
+    """Configure logging only when running as the service, so importing this module leaves it alone"""
+    _setup_logging()
+
+@app.on_event("startup")
+def purge_trash():
+    """Remove scan dirs left in the trash by a previous crash"""
+    _cleanup_pool.submit(shutil.rmtree, _TRASH, ignore_errors=True)
 
 @app.get("/")
 async def index():
@@ -257,88 +396,83 @@ async def health():
     ok = bool(GITGUARDIAN_API_KEY and MCP_S3_BUCKET)
     return {"status": "healthy" if ok else "unhealthy", "gitguardian_configured": bool(GITGUARDIAN_API_KEY), "mcp_s3_bucket": bool(MCP_S3_BUCKET)}
 
-@app.post("/scan_mcp")
-async def scan_mcp(req: MCPScanRequest):
-    """
-    Body: { "name": "<mcp-server-name>" }
-    Fetches mcp.json from S3, finds the server by name, clones the associated repo,
-    runs ggshield scan on it, returns results.
-    """
+def check_scan_config():
     if not GITGUARDIAN_API_KEY:
         raise HTTPException(status_code=500, detail="GITGUARDIAN_API_KEY not configured on server")
     if not MCP_S3_BUCKET:
         raise HTTPException(status_code=500, detail="MCP_S3_BUCKET not configured on server")
 
-    print("\n" + "=" * 70)
-    print("🚀 Automated GitGuardian MCP Scanner")
-    print("=" * 70)
-    print(f"\n✅ MCP Server Name: {req.name}")
-    print(f"✅ S3 Bucket: {MCP_S3_BUCKET}")
-    print(f"✅ S3 Key: {MCP_S3_KEY}")
+def scan_server(name: str):
+    """
+    Fetch mcp.json from S3, find the server by name, clone the associated repo and
+    run ggshield on it. Returns (response_content, status_code); raises HTTPException.
+    Each call works in its own temp directory, so several can run concurrently.
+    """
+    logger.info("🚀 Automated GitGuardian MCP Scanner: %s (s3://%s/%s)", name, MCP_S3_BUCKET, MCP_S3_KEY)
 
-    temp_root = tempfile.mkdtemp(prefix="mcp_ggshield_scan_")
+    temp_root = tempfile.mkdtemp(prefix="mcp_ggshield_scan_", dir=MCP_SCAN_TMPDIR)
     clone_dir = os.path.join(temp_root, "repo")
     
     try:
-        # Step 1: Fetch mcp.json from S3
-        print(f"\n[1/5] 🔧 Fetching MCP Configuration from S3")
+        # Steps 1-2: Stream mcp.json from S3 and stop at the matching server entry
+        logger.info("[1/5] 🔧 Fetching MCP Configuration from S3")
+        logger.info("[2/5] 🔍 Searching for MCP Server")
         try:
-            mcp_json = get_mcp_json_from_s3(MCP_S3_BUCKET, MCP_S3_KEY)
-            print("   ✅ Successfully fetched mcp.json")
+            server = find_server_streaming(MCP_S3_BUCKET, MCP_S3_KEY, name)
         except Exception as e:
-            print(f"   ❌ Failed to fetch mcp.json: {e}")
+            logger.error("❌ Failed to fetch mcp.json: %s", e)
             raise HTTPException(status_code=500, detail=f"Failed to fetch mcp.json: {e}")
-
-        # Step 2: Find server entry
-        print(f"\n[2/5] 🔍 Searching for MCP Server")
-        server = find_server_entry(mcp_json, req.name)
         if not server:
-            print(f"   ❌ Server '{req.name}' not found")
-            raise HTTPException(status_code=404, detail=f"MCP server '{req.name}' not found in {MCP_S3_KEY}")
+            logger.error("❌ Server '%s' not found", name)
+            raise HTTPException(status_code=404, detail=f"MCP server '{name}' not found in {MCP_S3_KEY}")
 
         repo_info = server.get("repository") or {}
         repo_url = repo_info.get("url")
         if not repo_url:
-            print(f"   ❌ No repository URL defined")
-            raise HTTPException(status_code=400, detail=f"No repository URL defined for MCP server '{req.name}'")
+            logger.error("❌ No repository URL defined for %s", name)
+            raise HTTPException(status_code=400, detail=f"No repository URL defined for MCP server '{name}'")
         
-        print(f"   ✅ Found server: {server.get('name')}")
-        print(f"   📦 Repository: {repo_url}")
+        logger.info("✅ Found server: %s (%s)", server.get('name'), repo_url)
         
         owner, repo = extract_repo_name(repo_url)
-        repo_name = f"{owner}_{repo}" if owner and repo else req.name
+        repo_name = f"{owner}_{repo}" if owner and repo else name
         project_key = f"mcp_{repo_name}"
 
+        # Reuse the result of an earlier scan of the same commit when it has not expired
+        cache_key = None
+        if MCP_SCAN_CACHE_TTL > 0 and boto3 is not None:
+            sha = get_remote_head_sha(repo_url)
+            if sha:
+                cache_key = scan_cache_key(repo_url, sha)
+                cached = get_cached_scan(MCP_S3_BUCKET, cache_key)
+                if cached:
+                    logger.info("♻️  Returning cached scan for commit %s", sha[:12])
+                    return cached["content"], cached["status_code"]
+
         # Step 3: Clone repository
-        print(f"\n[3/5] 📥 Cloning Repository")
+        logger.info("[3/5] 📥 Cloning Repository")
         if not clone_repository(repo_url, clone_dir):
-            cleanup(temp_root)
             raise HTTPException(status_code=500, detail=f"Failed to clone repository '{repo_url}'")
 
         # Step 4: Run GitGuardian scan
-        print(f"\n[4/5] 🔍 Running GitGuardian Security Scan")
+        logger.info("[4/5] 🔍 Running GitGuardian Security Scan")
         scan_result = run_ggshield_scan(clone_dir)
         
         if 'error' in scan_result:
-            print(f"   ❌ Scan error: {scan_result['error']}")
-            cleanup(temp_root)
+            logger.error("❌ Scan error: %s", scan_result['error'])
             raise HTTPException(status_code=500, detail=f"Scan failed: {scan_result['error']}")
 
         # Step 5: Generate report
-        print(f"\n[5/5] 📄 Generating Report")
+        logger.info("[5/5] 📄 Generating Report")
         report_file, report_data = save_report(repo_name, project_key, scan_result, repo_url)
         
         # Print summary
         print_summary(report_data)
         
-        print("\n" + "=" * 70)
         if scan_result.get('exit_code') == 0:
-            print("✅ Scan Complete - No Secrets Found!")
+            logger.info("✅ Scan Complete - No Secrets Found! Report: %s", report_file)
         else:
-            print("⚠️  Scan Complete - Secrets Detected!")
-        print("=" * 70)
-        print(f"\n📁 Report saved to: {report_file}")
-        print()
+            logger.warning("⚠️  Scan Complete - Secrets Detected! Report: %s", report_file)
 
         # Prepare API response
         response = {
@@ -356,14 +490,52 @@ async def scan_mcp(req: MCPScanRequest):
             response['total_secrets'] = len(report_data['secrets'])
 
         status_code = 200 if scan_result.get("exit_code") == 0 else 400
-        return JSONResponse(content=response, status_code=status_code)
+        if cache_key:
+            put_cached_scan(MCP_S3_BUCKET, cache_key, {"content": response, "status_code": status_code})
+        return response, status_code
 
     except HTTPException:
         raise
     finally:
-        print("\n🧹 Cleaning up temporary files...")
-        cleanup(temp_root)
-        print("   ✅ Cleanup complete\n")
+        logger.info("🧹 Cleaning up temporary files...")
+        discard(temp_root)
+
+@app.post("/scan_mcp")
+async def scan_mcp(req: MCPScanRequest):
+    """
+    Body: { "name": "<mcp-server-name>" }
+    Fetches mcp.json from S3, finds the server by name, clones the associated repo,
+    runs ggshield scan on it, returns results.
+    """
+    check_scan_config()
+    # Clone and scan block for minutes; keep them off the event loop
+    content, status_code = await run_in_threadpool(scan_server, req.name)
+    return JSONResponse(content=content, status_code=status_code)
+
+@app.post("/scan_mcp_batch")
+def scan_mcp_batch(req: MCPBatchScanRequest):
+    """
+    Body: { "names": ["<mcp-server-name>", ...] }
+    Scans several MCP servers concurrently (MCP_SCAN_CONCURRENCY workers) and
+    returns one result per name, in request order. Declared sync so FastAPI runs
+    it in its threadpool instead of blocking the event loop.
+    """
+    check_scan_config()
+    
+    def scan_one(name):
+        try:
+            content, status_code = scan_server(name)
+        except HTTPException as e:
+            return {"name": name, "status_code": e.status_code, "error": e.detail}
+        except Exception as e:
+            return {"name": name, "status_code": 500, "error": str(e)}
+        return {"name": name, "status_code": status_code, "result": content}
+    
+    workers = max(1, min(MCP_SCAN_CONCURRENCY, len(req.names)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(scan_one, req.names))
+    
+    return {"results": results}
 
 if __name__ == "__main__":
     print("\n" + "=" * 70)
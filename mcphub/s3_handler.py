@@ -1,17 +1,116 @@
-import json
+import contextlib
+import functools
+import io
+import os
+import random
+import time
+from pathlib import Path
+import ijson
+import orjson
 import boto3
 from botocore.exceptions import ClientError
 
+CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'mcphub'
+PUT_ATTEMPTS = 3
+
+# bucket -> (ETag, body) of the mcp.json last read or written; ETag None means the object did not exist
+_seen = {}
+
+@functools.lru_cache(maxsize=None)
 def get_s3_client():
-    return boto3.client('s3')
+    """Build the S3 client once per process; botocore model loading dominates client creation"""
+    return boto3.session.Session().client('s3')
+
+def _cache_enabled():
+    return os.environ.get('MCPHUB_NO_CACHE') != '1'
+
+def _cache_paths(bucket_name):
+    return CACHE_DIR / f"mcp.{bucket_name}.json", CACHE_DIR / f"mcp.{bucket_name}.etag"
+
+def _write_cache(bucket_name, etag, body):
+    json_path, etag_path = _cache_paths(bucket_name)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Body first, then the ETag that vouches for it, each swapped in atomically
+        for path, data in ((json_path, body), (etag_path, etag.encode())):
+            tmp = path.with_name(path.name + '.tmp')
+            tmp.write_bytes(data)
+            os.replace(tmp, path)
+    except OSError:
+        pass
+
+def _is_missing(error):
+    return error.response['Error']['Code'] in ('NoSuchKey', '404')
+
+def _is_conflict(error):
+    return error.response['Error']['Code'] in ('PreconditionFailed', '412', 'ConditionalRequestConflict', '409')
+
+class _TeeStream:
+    """File-like that copies every chunk read from a stream into sink"""
+    
+    def __init__(self, body, sink):
+        self._body = body
+        self._sink = sink
+    
+    def read(self, size=-1):
+        chunk = self._body.read(size)
+        self._sink.write(chunk)
+        return chunk
+
+def _get_mcp_object(s3, bucket_name):
+    """Return (cached bytes, None) when the local copy is still current, else (None, get_object response)"""
+    json_path, etag_path = _cache_paths(bucket_name)
+    etag = None
+    if _cache_enabled():
+        try:
+            etag = etag_path.read_text()
+        except OSError:
+            pass
+    
+    try:
+        if etag:
+            try:
+                return None, s3.get_object(Bucket=bucket_name, Key='mcp.json', IfNoneMatch=etag)
+            except ClientError as e:
+                if e.response['Error']['Code'] not in ('304', 'NotModified'):
+                    raise
+                try:
+                    body = json_path.read_bytes()
+                    _seen[bucket_name] = (etag, body)
+                    return body, None
+                except OSError:
+                    pass
+        return None, s3.get_object(Bucket=bucket_name, Key='mcp.json')
+    except ClientError as e:
+        if _is_missing(e):
+            _seen[bucket_name] = (None, None)
+        raise
+
+def _remember(bucket_name, etag, body):
+    _seen[bucket_name] = (etag, body)
+    if _cache_enabled():
+        _write_cache(bucket_name, etag, body)
+
+def _load_mcp_bytes(s3, bucket_name):
+    """Return the raw mcp.json bytes, revalidating the local copy with a conditional GET"""
+    body, response = _get_mcp_object(s3, bucket_name)
+    if body is None:
+        body = response['Body'].read()
+        _remember(bucket_name, response['ETag'], body)
+    return body
+
+def _fetch_mcp_json(s3, bucket_name):
+    return orjson.loads(_load_mcp_bytes(s3, bucket_name))
 
 def check_server_exists(bucket_name, server_name):
     s3 = get_s3_client()
+    # A push earlier in the same batch counts even though it is not in S3 yet
+    pushed = _pending is not None and any(s.get('name') == server_name for s in _pending.get(bucket_name, []))
     try:
-        response = s3.get_object(Bucket=bucket_name, Key='mcp.json')
-        content = response['Body'].read().decode('utf-8')
-        mcp_data = json.loads(content)
+        mcp_data = _fetch_mcp_json(s3, bucket_name)
         
+        if pushed:
+            return True, mcp_data
         servers = mcp_data.get('servers', [])
         for server in servers:
             if server.get('name') == server_name:
@@ -20,51 +119,154 @@ def check_server_exists(bucket_name, server_name):
         return False, mcp_data
     
     except s3.exceptions.NoSuchKey:
-        return False, {"servers": []}
+        return pushed, {"servers": []}
     except ClientError as e:
-        if e.response['Error']['Code'] == 'NoSuchKey':
-            return False, {"servers": []}
+        if _is_missing(e):
+            return pushed, {"servers": []}
         raise
 
-def add_server_to_mcp(bucket_name, server_data):
+def _put_mcp_json(bucket_name, mcp_data):
+    """PUT mcp.json only if it is unchanged since we read it; raises a ClientError that _is_conflict() accepts otherwise"""
     s3 = get_s3_client()
-    
+    body = orjson.dumps(mcp_data, option=orjson.OPT_INDENT_2)
+    # Every PUT is conditional, so a registry we never managed to read is never replaced wholesale
+    etag, seen_body = _seen[bucket_name]
+    if body == seen_body:
+        return
+    condition = {'IfMatch': etag} if etag else {'IfNoneMatch': '*'}
+    response = s3.put_object(
+        Bucket=bucket_name,
+        Key='mcp.json',
+        Body=body,
+        ContentType='application/json',
+        **condition
+    )
+    if 'ETag' in response:
+        _seen[bucket_name] = (response['ETag'], body)
+        if _cache_enabled():
+            _write_cache(bucket_name, response['ETag'], body)
+
+# bucket -> server entries pushed but not yet written, in push order, while deferred_writes() is active
+_pending = None
+
+@contextlib.contextmanager
+def deferred_writes():
+    """Hold back add_server_to_mcp writes until the block exits, then PUT each touched bucket once"""
+    global _pending
+    if _pending is not None:
+        yield
+        return
+    _pending = {}
     try:
-        response = s3.get_object(Bucket=bucket_name, Key='mcp.json')
-        content = response['Body'].read().decode('utf-8')
-        mcp_data = json.loads(content)
-    except (s3.exceptions.NoSuchKey, ClientError):
-        mcp_data = {"servers": []}
+        yield
+    finally:
+        try:
+            flush_writes()
+        finally:
+            _pending = None
+
+def writes_deferred():
+    """True while add_server_to_mcp only queues entries for deferred_writes()"""
+    return _pending is not None
+
+def flush_writes():
+    """Write the server entries held back by deferred_writes() so later reads see them; a failed bucket stays queued"""
+    while _pending:
+        bucket_name, entries = next(iter(_pending.items()))
+        _commit(bucket_name, entries)
+        del _pending[bucket_name]
+
+def drop_writes():
+    """Forget the queued entries and return them as bucket -> server names"""
+    if not _pending:
+        return {}
+    dropped = {bucket_name: [s.get('name') for s in entries] for bucket_name, entries in _pending.items()}
+    _pending.clear()
+    return dropped
+
+@contextlib.contextmanager
+def mcp_transaction(bucket_name, mcp_data=None):
+    """Yield the mutable servers list of mcp.json and write it back once the block succeeds"""
+    # Without a successful read there is no ETag to make the write conditional on
+    if mcp_data is None or bucket_name not in _seen:
+        mcp_data = get_mcp_json(bucket_name)
     
-    servers = mcp_data.get('servers', [])
+    servers = mcp_data.setdefault('servers', [])
+    yield servers
     
+    _put_mcp_json(bucket_name, mcp_data)
+
+def _upsert(servers, server_data):
+    # One pass: drop the old entry (keeping its created_at) and append the new one
+    name = server_data['name']
     existing_server = None
+    kept = []
     for s in servers:
-        if s.get('name') == server_data['name']:
+        if s.get('name') != name:
+            kept.append(s)
+        elif existing_server is None:
             existing_server = s
-            break
     
     if existing_server and 'meta' in existing_server:
         server_data['meta']['created_at'] = existing_server['meta']['created_at']
     
-    servers = [s for s in servers if s.get('name') != server_data['name']]
-    servers.append(server_data)
-    mcp_data['servers'] = servers
-    
-    s3.put_object(
-        Bucket=bucket_name,
-        Key='mcp.json',
-        Body=json.dumps(mcp_data, indent=2),
-        ContentType='application/json'
-    )
-    
+    kept.append(server_data)
+    servers[:] = kept
+
+def _commit(bucket_name, entries, mcp_data=None):
+    """Apply entries to mcp.json and PUT it, re-reading and replaying them when another writer got there first"""
+    for attempt in range(PUT_ATTEMPTS):
+        try:
+            with mcp_transaction(bucket_name, mcp_data) as servers:
+                for server_data in entries:
+                    _upsert(servers, server_data)
+            return
+        except ClientError as e:
+            if not _is_conflict(e) or attempt == PUT_ATTEMPTS - 1:
+                raise
+            # Someone else wrote mcp.json since we read it: re-read and apply our entries again
+            mcp_data = None
+            time.sleep(random.uniform(0, 0.25 * 2 ** attempt))
+
+def add_server_to_mcp(bucket_name, server_data, mcp_data=None):
+    if _pending is not None:
+        _pending.setdefault(bucket_name, []).append(server_data)
+        return True
+    _commit(bucket_name, [server_data], mcp_data)
     return True
 
 def get_mcp_json(bucket_name):
     s3 = get_s3_client()
     try:
-        response = s3.get_object(Bucket=bucket_name, Key='mcp.json')
-        content = response['Body'].read().decode('utf-8')
-        return json.loads(content)
+        return _fetch_mcp_json(s3, bucket_name)
+    except ClientError as e:
+        # Only a missing mcp.json means an empty registry; access or service errors must not look like one
+        if _is_missing(e):
+            return {"servers": []}
+        raise
+
+def stream_mcp_json(bucket_name):
+    """Yield server entries from mcp.json as they are parsed, from the local cache when it is current"""
+    s3 = get_s3_client()
+    try:
+        body, response = _get_mcp_object(s3, bucket_name)
     except (s3.exceptions.NoSuchKey, ClientError):
-        return {"servers": []}
+        return
+    if body is not None:
+        yield from ijson.items(body, 'servers.item', use_float=True)
+        return
+    
+    # Parse while downloading and keep a copy for the cache; a caller that stops early skips the rest of the download
+    buffer = io.BytesIO()
+    with contextlib.closing(response['Body']) as stream:
+        yield from ijson.items(_TeeStream(stream, buffer), 'servers.item', use_float=True)
+    _remember(bucket_name, response['ETag'], buffer.getvalue())
+
+def find_server(bucket_name, server_name):
+    """Return (server, names seen) and stop reading mcp.json at the first match"""
+    names = []
+    for server in stream_mcp_json(bucket_name):
+        if server.get('name') == server_name:
+            return server, names
+        names.append(server.get('name'))
+    return None, names
@@ -1,48 +1,46 @@
 import os
+import collections
 import subprocess
 import tempfile
 import shutil
-import json
 import time
 import re
+import threading
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import ijson
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from ._repo import extract_repo_name
+from ._env import load_env_file
 
-def load_env_file(env_path=None):
-    if env_path is None:
-        env_path = Path.cwd() / ".env"
-    else:
-        env_path = Path(env_path)
-    
-    if env_path.exists():
-        with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    line = line.replace('export ', '')
-                    key, value = line.split('=', 1)
-                    value = value.strip('"').strip("'")
-                    os.environ[key] = value
+# The fetch_* helpers run concurrently; keep their lines from interleaving
+_print_lock = threading.Lock()
+
+def _say(message):
+    with _print_lock:
+        print(message)
+
+# One keep-alive session for every SonarCloud API call; transient 5xx on GETs are retried
+def create_session(sonar_token):
+    session = requests.Session()
+    session.headers["Authorization"] = f"Bearer {sonar_token}"
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504])
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries))
+    return session
 
-def extract_repo_name(repo_url):
-    repo_url = repo_url.strip().rstrip('/')
-    if repo_url.startswith('git@github.com:'):
-        repo_url = repo_url.replace('git@github.com:', '')
-    elif 'github.com/' in repo_url:
-        repo_url = repo_url.split('github.com/')[-1]
-    repo_url = repo_url.replace('.git', '')
-    parts = repo_url.split('/')
-    if len(parts) >= 2:
-        return parts[-2], parts[-1]
-    return None, None
+# Characters SonarCloud does not accept in a project key
+_KEY_UNSAFE_RE = re.compile(r'[^a-zA-Z0-9_\-.]')
 
 def generate_project_key(owner, repo, organization):
-    safe_owner = re.sub(r'[^a-zA-Z0-9_\-.]', '_', owner)
-    safe_repo = re.sub(r'[^a-zA-Z0-9_\-.]', '_', repo)
+    safe_owner = _KEY_UNSAFE_RE.sub('_', owner)
+    safe_repo = _KEY_UNSAFE_RE.sub('_', repo)
     return f"{organization}_{safe_owner}_{safe_repo}"
 
-def create_sonarcloud_project(project_key, project_name, sonar_host, sonar_token, sonar_org):
+def create_sonarcloud_project(session, project_key, project_name, sonar_host, sonar_org):
     print(f"   Creating project: {project_key}")
     url = f"{sonar_host}/api/projects/create"
     params = {
@@ -50,9 +48,8 @@ def create_sonarcloud_project(project_key, project_name, sonar_host, sonar_token
         "project": project_key,
         "name": project_name
     }
-    headers = {"Authorization": f"Bearer {sonar_token}"}
     try:
-        response = requests.post(url, params=params, headers=headers, timeout=30)
+        response = session.post(url, params=params, timeout=30)
         if response.status_code == 200:
             print("   ✅ Project created successfully")
             return True
@@ -71,12 +68,32 @@ def create_sonarcloud_project(project_key, project_name, sonar_host, sonar_token
         print(f"   ⚠️  Network error: {str(e)}")
         return False
 
+# Media, archives and compiled artifacts that no scanner reads; their blobs are never downloaded
+_SKIPPED_BLOBS = (
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.ico", "*.webp", "*.bmp", "*.psd",
+    "*.mp3", "*.mp4", "*.mov", "*.avi", "*.wav", "*.webm",
+    "*.zip", "*.tar", "*.gz", "*.tgz", "*.bz2", "*.xz", "*.7z", "*.rar",
+    "*.jar", "*.war", "*.whl", "*.so", "*.dll", "*.dylib", "*.exe", "*.pdf",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+)
+
 def clone_repository(repo_url, target_dir):
     print(f"   Cloning from: {repo_url}")
+    env = dict(os.environ, GIT_TERMINAL_PROMPT="0")
+    # Blobless clone, so only the files left in the sparse checkout below are fetched
     result = subprocess.run(
-        ["git", "clone", "--depth", "1", repo_url, target_dir],
-        capture_output=True, text=True
+        ["git", "clone", "--depth", "1", "--single-branch", "--no-tags", "--filter=blob:none", "--no-checkout",
+         repo_url, target_dir],
+        capture_output=True, text=True, env=env
     )
+    if result.returncode == 0:
+        sparse = subprocess.run(
+            ["git", "-C", target_dir, "sparse-checkout", "set", "--no-cone", "/*"] + [f"!{p}" for p in _SKIPPED_BLOBS],
+            capture_output=True, text=True, env=env
+        )
+        if sparse.returncode != 0:
+            print("   ⚠️  sparse-checkout unavailable, checking out the full tree")
+        result = subprocess.run(["git", "-C", target_dir, "checkout"], capture_output=True, text=True, env=env)
     if result.returncode != 0:
         print(f"   ❌ Clone failed: {result.stderr}")
         return False
@@ -89,7 +106,8 @@ def run_sonar_scanner(repo_path, project_key, sonar_host, sonar_token, sonar_org
     original_dir = os.getcwd()
     os.chdir(repo_path)
     try:
-        result = subprocess.run([
+        # Stream the scanner's output instead of buffering all of it; only the tail is shown on failure
+        proc = subprocess.Popen([
             "sonar-scanner",
             f"-Dsonar.projectKey={project_key}",
             f"-Dsonar.organization={sonar_org}",
@@ -97,40 +115,57 @@ def run_sonar_scanner(repo_path, project_key, sonar_host, sonar_token, sonar_org
             "-Dsonar.sourceEncoding=UTF-8",
             f"-Dsonar.host.url={sonar_host}",
             f"-Dsonar.login={sonar_token}"
-        ], capture_output=True, text=True, timeout=300)
-        if result.returncode != 0:
+        ], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, errors="replace", bufsize=1)
+        timed_out = threading.Event()
+        def kill():
+            timed_out.set()
+            proc.kill()
+        timer = threading.Timer(300, kill)
+        timer.start()
+        tail = collections.deque(maxlen=200)
+        task_lines = []
+        try:
+            for line in proc.stdout:
+                tail.append(line)
+                if 'ceTaskId' in line or 'task?' in line:
+                    task_lines.append(line.strip())
+            returncode = proc.wait()
+        finally:
+            timer.cancel()
+            proc.stdout.close()
+        if timed_out.is_set():
+            print("   ❌ Scanner timeout (>5 minutes)")
+            return False
+        if returncode != 0:
             print("   ❌ Scanner failed!")
             print("\n--- Scanner Output ---")
-            print(result.stdout)
-            if result.stderr:
-                print("\n--- Scanner Errors ---")
-                print(result.stderr)
+            print("".join(tail))
             return False
         print("   ✅ Scanner completed successfully")
-        for line in result.stdout.split('\n'):
-            if 'ceTaskId' in line or 'task?' in line:
-                print(f"   {line.strip()}")
+        for line in task_lines:
+            print(f"   {line}")
         return True
-    except subprocess.TimeoutExpired:
-        print("   ❌ Scanner timeout (>5 minutes)")
-        return False
     finally:
         os.chdir(original_dir)
 
-def wait_for_analysis_completion(project_key, sonar_host, sonar_token, max_wait=60):
+def wait_for_analysis_completion(session, project_key, sonar_host, max_wait=60):
     print("   Waiting for SonarCloud to process results...")
     url = f"{sonar_host}/api/ce/component"
     params = {"component": project_key}
-    headers = {"Authorization": f"Bearer {sonar_token}"}
     start_time = time.time()
+    # Small analyses finish in a second or two; back off from 0.5s to 5s for the rest
+    delay = 0.5
+    queued = False
     while time.time() - start_time < max_wait:
         try:
-            response = requests.get(url, params=params, headers=headers, timeout=10)
+            response = session.get(url, params=params, timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 if data.get("queue"):
                     print("   ⏳ Still in queue...", end='\r')
-                    time.sleep(3)
+                    queued = True
+                    time.sleep(delay)
+                    delay = min(delay * 1.7, 5.0)
                     continue
                 current = data.get("current")
                 if current:
@@ -139,8 +174,13 @@ def wait_for_analysis_completion(project_key, sonar_host, sonar_token, max_wait=
                         print("   ✅ Analysis processing complete     ")
                         return True
                     elif status in ["PENDING", "IN_PROGRESS"]:
+                        if queued:
+                            # Left the queue; the task itself is usually quick
+                            queued = False
+                            delay = 0.5
                         print(f"   ⏳ Status: {status}...", end='\r')
-                        time.sleep(3)
+                        time.sleep(delay)
+                        delay = min(delay * 1.7, 5.0)
                         continue
                     else:
                         print(f"   ⚠️  Status: {status}")
@@ -148,72 +188,75 @@ def wait_for_analysis_completion(project_key, sonar_host, sonar_token, max_wait=
                 else:
                     print("   ✅ Analysis appears ready")
                     return True
-            time.sleep(3)
+            time.sleep(delay)
+            delay = min(delay * 1.7, 5.0)
         except Exception as e:
             print(f"   ⚠️  Error checking status: {str(e)}")
-            time.sleep(3)
+            time.sleep(delay)
+            delay = min(delay * 1.7, 5.0)
     print("   ⚠️  Timeout waiting for analysis")
     return True
 
-def fetch_issues(project_key, sonar_host, sonar_token):
-    print("   Fetching issues...")
-    url = f"{sonar_host}/api/issues/search"
-    headers = {"Authorization": f"Bearer {sonar_token}"}
-    all_issues = []
-    page = 1
+# SonarCloud refuses to page past the first 10,000 results
+_MAX_RESULTS = 10000
+
+# Returns (items, rest of the first page); first_params are sent with page 1 only
+def _fetch_pages(session, url, params, key, what, first_params=None):
     page_size = 500
-    while True:
-        params = {"componentKeys": project_key, "ps": page_size, "p": page}
+    def get_page(page, extra=None):
         try:
-            response = requests.get(url, params=params, headers=headers, timeout=30)
-            if response.status_code != 200:
-                print(f"   ⚠️  Failed to fetch issues: {response.status_code}")
-                break
-            data = response.json()
-            issues = data.get("issues", [])
-            all_issues.extend(issues)
-            total = data.get("total", 0)
-            if len(all_issues) >= total or len(issues) < page_size:
-                break
-            page += 1
+            page_params = dict(params, ps=page_size, p=page, **(extra or {}))
+            with session.get(url, params=page_params, timeout=30, stream=True) as response:
+                if response.status_code != 200:
+                    _say(f"   ⚠️  Failed to fetch {what}: {response.status_code}")
+                    return None
+                # Parse straight off the socket so a page is never held as text and objects at once
+                response.raw.decode_content = True
+                return dict(ijson.kvitems(response.raw, "", use_float=True))
         except Exception as e:
-            print(f"   ⚠️  Error fetching issues: {str(e)}")
-            break
-    print(f"   ✅ Found {len(all_issues)} issues")
-    return all_issues
+            _say(f"   ⚠️  Error fetching {what}: {str(e)}")
+            return None
+    
+    first = get_page(1, first_params)
+    if first is None:
+        return [], {}
+    items = first.pop(key, [])
+    total = first.get("paging", {}).get("total", first.get("total", 0))
+    pages = min(-(-total // page_size), _MAX_RESULTS // page_size)
+    if len(items) < page_size or pages < 2:
+        return items, first
+    # The first page gives the total, so the rest can be requested at once; stop at the first failed page
+    with ThreadPoolExecutor(max_workers=min(8, pages - 1)) as pool:
+        for data in pool.map(get_page, range(2, pages + 1)):
+            if data is None:
+                break
+            items.extend(data.get(key, []))
+    return items, first
 
-def fetch_hotspots(project_key, sonar_host, sonar_token):
-    print("   Fetching security hotspots...")
+def fetch_issues(session, project_key, sonar_host):
+    _say("   Fetching issues...")
+    url = f"{sonar_host}/api/issues/search"
+    # Resolved issues don't count toward the project's bugs/vulnerabilities/code smells, so don't page through them
+    params = {"componentKeys": project_key, "resolved": "false"}
+    # Facets give exact per-severity and per-type totals, even past the 10,000-result paging limit
+    all_issues, first = _fetch_pages(session, url, params, "issues", "issues", {"facets": "severities,types"})
+    facets = {
+        facet.get("property"): {v.get("val"): v.get("count", 0) for v in facet.get("values", [])}
+        for facet in first.get("facets", [])
+    }
+    _say(f"   ✅ Found {len(all_issues)} issues")
+    return all_issues, facets
+
+def fetch_hotspots(session, project_key, sonar_host):
+    _say("   Fetching security hotspots...")
     url = f"{sonar_host}/api/hotspots/search"
-    headers = {"Authorization": f"Bearer {sonar_token}"}
-    all_hotspots = []
-    page = 1
-    page_size = 500
-    while True:
-        params = {"projectKey": project_key, "ps": page_size, "p": page}
-        try:
-            response = requests.get(url, params=params, headers=headers, timeout=30)
-            if response.status_code != 200:
-                print(f"   ⚠️  Failed to fetch hotspots: {response.status_code}")
-                break
-            data = response.json()
-            hotspots = data.get("hotspots", [])
-            all_hotspots.extend(hotspots)
-            paging = data.get("paging", {})
-            total = paging.get("total", 0)
-            if len(all_hotspots) >= total or len(hotspots) < page_size:
-                break
-            page += 1
-        except Exception as e:
-            print(f"   ⚠️  Error fetching hotspots: {str(e)}")
-            break
-    print(f"   ✅ Found {len(all_hotspots)} security hotspots")
+    all_hotspots, _ = _fetch_pages(session, url, {"projectKey": project_key}, "hotspots", "hotspots")
+    _say(f"   ✅ Found {len(all_hotspots)} security hotspots")
     return all_hotspots
 
-def fetch_measures(project_key, sonar_host, sonar_token):
-    print("   Fetching code metrics...")
+def fetch_measures(session, project_key, sonar_host):
+    _say("   Fetching code metrics...")
     url = f"{sonar_host}/api/measures/component"
-    headers = {"Authorization": f"Bearer {sonar_token}"}
     metric_keys = [
         "ncloc", "coverage", "bugs", "vulnerabilities", "code_smells",
         "security_hotspots", "sqale_rating", "reliability_rating",
@@ -221,41 +264,24 @@ def fetch_measures(project_key, sonar_host, sonar_token):
     ]
     params = {"component": project_key, "metricKeys": ",".join(metric_keys)}
     try:
-        response = requests.get(url, params=params, headers=headers, timeout=30)
+        response = session.get(url, params=params, timeout=30)
         if response.status_code != 200:
-            print(f"   ⚠️  Failed to fetch metrics: {response.status_code}")
+            _say(f"   ⚠️  Failed to fetch metrics: {response.status_code}")
             return {}
-        data = response.json()
+        data = orjson.loads(response.content)
         component = data.get("component", {})
         measures = component.get("measures", [])
-        metrics = {}
-        for measure in measures:
-            metric = measure.get("metric")
-            value = measure.get("value")
-            metrics[metric] = value
-        print(f"   ✅ Retrieved {len(metrics)} metrics")
+        metrics = {m.get("metric"): m.get("value") for m in measures if m.get("metric") is not None}
+        _say(f"   ✅ Retrieved {len(metrics)} metrics")
         return metrics
     except Exception as e:
-        print(f"   ⚠️  Error fetching metrics: {str(e)}")
+        _say(f"   ⚠️  Error fetching metrics: {str(e)}")
         return {}
 
-def format_issues_by_severity(issues):
-    by_severity = {"BLOCKER": [], "CRITICAL": [], "MAJOR": [], "MINOR": [], "INFO": []}
-    for issue in issues:
-        severity = issue.get("severity", "INFO")
-        by_severity[severity].append({
-            "type": issue.get("type"),
-            "rule": issue.get("rule"),
-            "message": issue.get("message"),
-            "file": issue.get("component", "").split(":")[-1],
-            "line": issue.get("line"),
-            "status": issue.get("status")
-        })
-    return by_severity
-
-def save_report(repo_name, project_key, issues, hotspots, metrics, sonar_host, output_dir=None):
+def save_report(repo_name, project_key, issues, hotspots, metrics, sonar_host, output_dir=None, facets=None):
     print("   Generating report...")
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    now = datetime.now()
+    timestamp = now.strftime("%Y%m%d_%H%M%S")
     
     if output_dir is None:
         report_dir = Path.cwd() / "reports"
@@ -263,32 +289,53 @@ def save_report(repo_name, project_key, issues, hotspots, metrics, sonar_host, o
         report_dir = Path(output_dir)
     
     report_dir.mkdir(exist_ok=True)
-    issues_by_severity = format_issues_by_severity(issues)
-    bugs = [i for i in issues if i.get("type") == "BUG"]
-    vulnerabilities = [i for i in issues if i.get("type") == "VULNERABILITY"]
-    code_smells = [i for i in issues if i.get("type") == "CODE_SMELL"]
+    # One pass over the issues for both the type counts and the severity buckets
+    issues_by_severity = {"BLOCKER": [], "CRITICAL": [], "MAJOR": [], "MINOR": [], "INFO": []}
+    type_counts = {"BUG": 0, "VULNERABILITY": 0, "CODE_SMELL": 0}
+    for issue in issues:
+        get = issue.get
+        issue_type = get("type")
+        if issue_type in type_counts:
+            type_counts[issue_type] += 1
+        issues_by_severity[get("severity", "INFO")].append({
+            "type": issue_type,
+            "rule": get("rule"),
+            "message": get("message"),
+            "file": get("component", "").split(":")[-1],
+            "line": get("line"),
+            "status": get("status")
+        })
+    # Server-side facet counts cover every issue; the loop above only sees the fetched pages
+    severity_counts = {severity: len(bucket) for severity, bucket in issues_by_severity.items()}
+    total_issues = len(issues)
+    if facets and "severities" in facets:
+        severity_counts = {k: facets["severities"].get(k, 0) for k in severity_counts}
+        # Every issue has exactly one severity, so the facet adds up to the server's total
+        total_issues = sum(facets["severities"].values())
+    if facets and "types" in facets:
+        type_counts = {k: facets["types"].get(k, 0) for k in type_counts}
     report = {
         "metadata": {
             "repository": repo_name,
             "project_key": project_key,
-            "analysis_date": datetime.now().isoformat(),
+            "analysis_date": now.isoformat(),
             "sonarcloud_url": f"{sonar_host}/dashboard?id={project_key}"
         },
         "summary": {
-            "total_issues": len(issues),
-            "bugs": len(bugs),
-            "vulnerabilities": len(vulnerabilities),
-            "code_smells": len(code_smells),
+            "total_issues": total_issues,
+            "bugs": type_counts["BUG"],
+            "vulnerabilities": type_counts["VULNERABILITY"],
+            "code_smells": type_counts["CODE_SMELL"],
             "security_hotspots": len(hotspots)
         },
         "metrics": metrics,
         "issues": {
             "by_severity": {
-                "blocker": len(issues_by_severity["BLOCKER"]),
-                "critical": len(issues_by_severity["CRITICAL"]),
-                "major": len(issues_by_severity["MAJOR"]),
-                "minor": len(issues_by_severity["MINOR"]),
-                "info": len(issues_by_severity["INFO"])
+                "blocker": severity_counts["BLOCKER"],
+                "critical": severity_counts["CRITICAL"],
+                "major": severity_counts["MAJOR"],
+                "minor": severity_counts["MINOR"],
+                "info": severity_counts["INFO"]
             },
             "details": issues_by_severity
         },
@@ -304,12 +351,10 @@ def save_report(repo_name, project_key, issues, hotspots, metrics, sonar_host, o
         ]
     }
     report_file = report_dir / f"full-analysis-{repo_name}-{timestamp}.json"
-    with open(report_file, 'w') as f:
-        json.dump(report, f, indent=2)
+    report_file.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
     print(f"   ✅ Report saved: {report_file}")
     latest_file = report_dir / "analysis-report.json"
-    with open(latest_file, 'w') as f:
-        json.dump(report, f, indent=2)
+    shutil.copyfile(report_file, latest_file)
     print(f"   ✅ Latest report: {latest_file}")
     return report_file, report
 
@@ -346,7 +391,7 @@ def print_summary(report_data):
         rating = chr(64 + int(float(metrics["sqale_rating"])))
         print(f"   Maintainability:     {rating} {ratings.get(rating, '')}")
 
-def run_analysis(repo_url, env_path=None):
+def run_analysis(repo_url, env_path=None, clone_path=None):
     load_env_file(env_path)
     
     SONAR_HOST = "https://sonarcloud.io"
@@ -376,30 +421,49 @@ def run_analysis(repo_url, env_path=None):
     print(f"   Repo: {repo}")
     print(f"   Project Key: {project_key}")
     
-    tmp_dir = tempfile.mkdtemp(prefix="sonarcloud_auto_")
-    repo_path = os.path.join(tmp_dir, "repo")
+    # Callers that already cloned the repository (push) pass it in so it is fetched only once
+    tmp_dir = None
+    if clone_path is None:
+        tmp_dir = tempfile.mkdtemp(prefix="sonarcloud_auto_")
+        repo_path = os.path.join(tmp_dir, "repo")
+    else:
+        repo_path = clone_path
+    
+    session = create_session(SONAR_TOKEN)
     
     try:
         print(f"\n[1/5] 🔧 Creating SonarCloud Project")
-        if not create_sonarcloud_project(project_key, f"{owner}/{repo}", SONAR_HOST, SONAR_TOKEN, SONAR_ORGANIZATION):
+        if not create_sonarcloud_project(session, project_key, f"{owner}/{repo}", SONAR_HOST, SONAR_ORGANIZATION):
             print("\n⚠️  Warning: Could not create project, will try to proceed...")
         
         print(f"\n[2/5] 📥 Cloning Repository")
-        if not clone_repository(repo_url, repo_path):
+        if clone_path is not None:
+            print(f"   Using existing clone: {repo_path}")
+        elif not clone_repository(repo_url, repo_path):
             raise RuntimeError("❌ Failed to clone repository")
         
         print(f"\n[3/5] 🔍 Running SonarCloud Analysis")
         if not run_sonar_scanner(repo_path, project_key, SONAR_HOST, SONAR_TOKEN, SONAR_ORGANIZATION):
             raise RuntimeError("❌ Failed to run scanner")
+        if clone_path is not None:
+            # Keep the scanner's work files out of the tree the caller scans next
+            shutil.rmtree(os.path.join(repo_path, ".scannerwork"), ignore_errors=True)
         
         print(f"\n[4/5] 📊 Fetching Analysis Results")
-        wait_for_analysis_completion(project_key, SONAR_HOST, SONAR_TOKEN)
-        issues = fetch_issues(project_key, SONAR_HOST, SONAR_TOKEN)
-        hotspots = fetch_hotspots(project_key, SONAR_HOST, SONAR_TOKEN)
-        metrics = fetch_measures(project_key, SONAR_HOST, SONAR_TOKEN)
+        wait_for_analysis_completion(session, project_key, SONAR_HOST)
+        # Independent GETs against the same host; wall time is the slowest of the three
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            issues_future = pool.submit(fetch_issues, session, project_key, SONAR_HOST)
+            hotspots_future = pool.submit(fetch_hotspots, session, project_key, SONAR_HOST)
+            metrics_future = pool.submit(fetch_measures, session, project_key, SONAR_HOST)
+        issues, issue_facets = issues_future.result()
+        hotspots = hotspots_future.result()
+        metrics = metrics_future.result()
         
         print(f"\n[5/5] 📄 Generating Report")
-        report_file, report_data = save_report(repo_name, project_key, issues, hotspots, metrics, SONAR_HOST)
+        report_file, report_data = save_report(
+            repo_name, project_key, issues, hotspots, metrics, SONAR_HOST, facets=issue_facets
+        )
         
         print_summary(report_data)
         
@@ -422,7 +486,13 @@ def run_analysis(repo_url, env_path=None):
         }
         
     finally:
-        print("\n🧹 Cleaning up temporary files...")
-        os.chdir("/")
-        shutil.rmtree(tmp_dir, ignore_errors=True)
-        print("   ✅ Cleanup complete")
+        session.close()
+        if tmp_dir is not None:
+            print("\n🧹 Cleaning up temporary files...")
+            os.chdir("/")
+            # Not a daemon thread: the caller gets the result right away, but the interpreter still
+            # waits for the delete before exiting so no half-removed clone is left behind
+            threading.Thread(
+                target=shutil.rmtree, args=(tmp_dir,), kwargs={"ignore_errors": True}, name="sonar-cleanup"
+            ).start()
+            print("   ✅ Cleanup started in the background")
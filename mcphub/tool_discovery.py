@@ -3,30 +3,49 @@ import json
 import re
 from pathlib import Path
 
+# Each pattern keeps its own literal prefix, which re searches for far faster than one combined alternation.
+# Patterns run over raw bytes; the names they capture are decoded as UTF-8 afterwards
+_TOOL_PATTERNS = [re.compile(p, re.MULTILINE) for p in (
+    rb'@server\.call_tool\(["\']([^"\']+)["\']\)',
+    rb'@mcp\.tool\(["\']([^"\']+)["\']\)',
+    rb'@server\.tool\(["\']([^"\']+)["\']\)',
+    rb'Tool\(name=["\']([^"\']+)["\']\)',
+    rb'name=["\']([^"\']+)["\'].*type=["\']tool["\']',
+    # \x80-\xff keeps non-ASCII identifiers whole, as \w on bytes is ASCII-only
+    rb'def\s+([\w\x80-\xff]+).*@.*tool',
+)]
+_TOOLS_SECTION = re.compile(rb'["\']tools["\']\s*:\s*\[(.*?)\]', re.DOTALL)
+_TOOLS_SECTION_NAME = re.compile(rb'["\']name["\']\s*:\s*["\']([^"\']+)["\']')
+# Dependency, virtualenv and build trees never hold the server's own tools
+_SKIP_DIRS = {'.git', 'node_modules', 'venv', '.venv', '__pycache__', '.tox', 'dist', 'build', 'site-packages'}
+
+def _iter_py_files(root):
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS]
+        for name in filenames:
+            if name.endswith('.py'):
+                yield os.path.join(dirpath, name)
+
 def discover_tools_from_repo(repo_path):
     """
     Discover MCP tools from a repository by analyzing Python files.
     Returns dict with tool_count and tool_names list.
     """
-    tools = []
-    
-    python_files = list(Path(repo_path).rglob("*.py"))
+    tools = set()
     
-    for py_file in python_files:
+    for py_file in _iter_py_files(repo_path):
         try:
-            with open(py_file, 'r', encoding='utf-8') as f:
+            # Read undecoded; the patterns are ASCII and only the matches need decoding
+            with open(py_file, 'rb') as f:
                 content = f.read()
             
-            file_tools = extract_tools_from_python(content)
-            tools.extend(file_tools)
+            tools.update(_iter_tools(content))
         except Exception:
             continue
     
-    unique_tools = list(set(tools))
-    
     return {
-        "tool_count": len(unique_tools),
-        "tool_names": sorted(unique_tools)
+        "tool_count": len(tools),
+        "tool_names": sorted(tools)
     }
 
 def extract_tools_from_python(content):
@@ -34,33 +53,29 @@ def extract_tools_from_python(content):
     Extract MCP tool names from Python code.
     Looks for @server.call_tool, @mcp.tool, and similar patterns.
     """
-    tools = []
-    
-    tool_patterns = [
-        r'@server\.call_tool\(["\']([^"\']+)["\']\)',
-        r'@mcp\.tool\(["\']([^"\']+)["\']\)',
-        r'@server\.tool\(["\']([^"\']+)["\']\)',
-        r'Tool\(name=["\']([^"\']+)["\']\)',
-        r'name=["\']([^"\']+)["\'].*type=["\']tool["\']',
-        r'def\s+(\w+).*@.*tool',
-    ]
-    
-    for pattern in tool_patterns:
-        matches = re.findall(pattern, content, re.MULTILINE)
-        tools.extend(matches)
+    if isinstance(content, str):
+        content = content.encode('utf-8', 'surrogateescape')
+    return list(_iter_tools(content))
+
+def _iter_tools(content):
+    """Yield tool names found in Python source bytes"""
+    for pattern in _TOOL_PATTERNS:
+        for match in pattern.findall(content):
+            if _is_tool_name(match):
+                yield match.decode('utf-8', 'replace')
     
-    if '"tools"' in content or "'tools'" in content:
+    if b'"tools"' in content or b"'tools'" in content:
         try:
-            tools_section = re.search(r'["\']tools["\']\s*:\s*\[(.*?)\]', content, re.DOTALL)
+            tools_section = _TOOLS_SECTION.search(content)
             if tools_section:
-                tool_names = re.findall(r'["\']name["\']\s*:\s*["\']([^"\']+)["\']', tools_section.group(1))
-                tools.extend(tool_names)
+                for match in _TOOLS_SECTION_NAME.findall(tools_section.group(1)):
+                    if _is_tool_name(match):
+                        yield match.decode('utf-8', 'replace')
         except Exception:
             pass
-    
-    tools = [t for t in tools if t and not t.startswith('_') and len(t) > 1]
-    
-    return tools
+
+def _is_tool_name(name):
+    return name and not name.startswith(b'_') and len(name) > 1
 
 def discover_tools_from_package_json(repo_path):
     """
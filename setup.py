@@ -8,9 +8,11 @@ setup(
     install_requires=[
         "requests>=2.31.0",
         "click>=8.1.0",
-        "boto3>=1.28.0",
+        "boto3>=1.36.0",
         "urllib3>=2.0.0",
         "certifi>=2023.7.22",
+        "orjson>=3.9.0",
+        "ijson>=3.1",
     ],
     entry_points={
         "console_scripts": [